@@ -0,0 +1,138 @@
+"""Benchmarks the numpy get_bounds() against the previous pure Python implementation.
+
+Usage:
+    python benchmarks/bench_get_bounds.py [--features 10000] [--vertices 100]
+"""
+import argparse
+import math
+import random
+import timeit
+
+from eefolium.common import get_bounds, get_feature_bounds
+
+
+# The pure Python implementation get_bounds() used before it was vectorized.
+
+def explode(coords):
+    """Explode a GeoJSON geometry's coordinates object and yield
+    coordinate tuples. As long as the input is conforming, the type of
+    the geometry doesn't matter.  From Fiona 1.4.8"""
+    for e in coords:
+        if isinstance(e, (float, int)):
+            yield coords
+            break
+        else:
+            for f in explode(e):
+                yield f
+
+
+def legacy_get_bounds(geometry, north_up=True, transform=None):
+    """Bounding box of a GeoJSON geometry, GeometryCollection, or FeatureCollection.
+    left, bottom, right, top
+    *not* xmin, ymin, xmax, ymax
+    If not north_up, y will be switched to guarantee the above.
+    Source code adapted from https://github.com/mapbox/rasterio/blob/master/rasterio/features.py#L361
+    """
+
+    if 'bbox' in geometry:
+        return tuple(geometry['bbox'])
+
+    geometry = geometry.get('geometry') or geometry  
+
+    # geometry must be a geometry, GeometryCollection, or FeatureCollection
+    if not ('coordinates' in geometry or 'geometries' in geometry or 'features' in geometry):
+        raise ValueError(
+            "geometry must be a GeoJSON-like geometry, GeometryCollection, "
+            "or FeatureCollection"
+        )
+
+    if 'features' in geometry:
+        # Input is a FeatureCollection
+        xmins = []
+        ymins = []
+        xmaxs = []
+        ymaxs = []
+        for feature in geometry['features']:
+            xmin, ymin, xmax, ymax = legacy_get_bounds(feature['geometry'])
+            xmins.append(xmin)
+            ymins.append(ymin)
+            xmaxs.append(xmax)
+            ymaxs.append(ymax)
+        if north_up:
+            return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
+        else:
+            return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
+
+    elif 'geometries' in geometry:
+        # Input is a geometry collection
+        xmins = []
+        ymins = []
+        xmaxs = []
+        ymaxs = []
+        for geometry in geometry['geometries']:
+            xmin, ymin, xmax, ymax = legacy_get_bounds(geometry)
+            xmins.append(xmin)
+            ymins.append(ymin)
+            xmaxs.append(xmax)
+            ymaxs.append(ymax)
+        if north_up:
+            return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
+        else:
+            return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
+
+    elif 'coordinates' in geometry:
+        # Input is a singular geometry object
+        if transform is not None:
+            xyz = list(explode(geometry['coordinates']))
+            xyz_px = [transform * point for point in xyz]
+            xyz = tuple(zip(*xyz_px))
+            return min(xyz[0]), max(xyz[1]), max(xyz[0]), min(xyz[1])
+        else:
+            xyz = tuple(zip(*list(explode(geometry['coordinates']))))
+            if north_up:
+                return min(xyz[0]), min(xyz[1]), max(xyz[0]), max(xyz[1])
+            else:
+                return min(xyz[0]), max(xyz[1]), max(xyz[0]), min(xyz[1])
+
+    # all valid inputs returned above, so whatever falls through is an error
+    raise ValueError(
+            "geometry must be a GeoJSON-like geometry, GeometryCollection, "
+            "or FeatureCollection"
+        )
+
+
+def random_polygons(n_features, n_vertices, seed=0):
+    """Generates a FeatureCollection of random polygons with n_vertices each."""
+    rng = random.Random(seed)
+    features = []
+    for _ in range(n_features):
+        x, y = rng.uniform(-180, 180), rng.uniform(-85, 85)
+        radius = rng.uniform(0.01, 1)
+        ring = [[x + radius * math.cos(2 * math.pi * i / n_vertices),
+                 y + radius * math.sin(2 * math.pi * i / n_vertices)] for i in range(n_vertices)]
+        ring.append(ring[0])
+        features.append({'type': 'Feature', 'properties': {},
+                         'geometry': {'type': 'Polygon', 'coordinates': [ring]}})
+    return {'type': 'FeatureCollection', 'features': features}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--features', type=int, default=10000)
+    parser.add_argument('--vertices', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    fc = random_polygons(args.features, args.vertices)
+    assert tuple(get_bounds(fc)) == tuple(legacy_get_bounds(fc))
+
+    print('{} features, {} vertices'.format(args.features, args.features * (args.vertices + 1)))
+    for name, func in [('legacy get_bounds', lambda: legacy_get_bounds(fc)),
+                       ('get_bounds', lambda: get_bounds(fc)),
+                       ('get_feature_bounds', lambda: get_feature_bounds(fc))]:
+        seconds = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print('{:<20} {:>8.3f} s'.format(name, seconds))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,15 @@
 """This module contains some common functions for both folium and ipyleaflet to interact with the Earth Engine Python API.
 """
 
+import copy
 import csv
+import itertools
 import math
 import os
 import subprocess
 import shutil
 import tarfile
+import threading
 import urllib.request
 import zipfile
 import ee
@@ -421,6 +424,280 @@ def hex_to_rgb(value='FFFFFF'):
     return tuple(int(value[i:i+lv//3], 16) for i in range(0, lv, lv//3))
 
 
+########################################
+#            Map ID Cache              #
+########################################
+
+class _LRUCache:
+    """A thread-safe in-memory least-recently-used cache with optional time-to-live expiry.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries to keep. Defaults to 256.
+        ttl (float, optional): The number of seconds an entry stays valid. None means entries never expire. Defaults to None.
+    """
+
+    def __init__(self, maxsize=256, ttl=None):
+        import threading
+        from collections import OrderedDict
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        import time
+
+        with self._lock:
+            if key not in self._data:
+                return None
+            created, value = self._data[key]
+            if self.ttl is not None and time.time() - created > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, created=None):
+        import time
+
+        if created is None:
+            created = time.time()
+        with self._lock:
+            self._data[key] = (created, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class MapIdCache:
+    """Caches the tile URLs returned by ee.Image.getMapId() so that repeated renders of the same layers skip the server call.
+
+    Entries are keyed on a hash of the serialized Earth Engine expression and the normalized visualization parameters. An in-memory LRU is always used; an optional SQLite file makes the cache persistent across sessions.
+
+    Args:
+        maxsize (int, optional): The maximum number of entries kept in memory. Defaults to 256.
+        ttl (float, optional): The number of seconds a map ID stays valid. Defaults to 3600.
+        db_path (str, optional): File path to a SQLite database used as an on-disk store. Defaults to None.
+    """
+
+    def __init__(self, maxsize=256, ttl=3600, db_path=None):
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._stats_lock = threading.Lock()
+        self._memory = _LRUCache(maxsize=maxsize, ttl=ttl)
+        self.db_path = None
+        if db_path is not None:
+            self.db_path = os.path.abspath(db_path)
+            out_dir = os.path.dirname(self.db_path)
+            if not os.path.exists(out_dir):
+                os.makedirs(out_dir)
+            with self._connect() as conn:
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS map_ids (key TEXT PRIMARY KEY, value TEXT, created REAL)')
+
+    def _connect(self):
+        import sqlite3
+
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    @staticmethod
+    def key(ee_object, vis_params={}):
+        """Computes the cache key of an Earth Engine object and its visualization parameters.
+
+        Args:
+            ee_object (object): The Earth Engine object to be visualized.
+            vis_params (dict, optional): The visualization parameters. Defaults to {}.
+
+        Returns:
+            str: A hex digest identifying the map ID request.
+        """
+        import hashlib
+        import json
+
+        params = {}
+        for k, v in (vis_params or {}).items():
+            if k in ('bands', 'palette', 'min', 'max', 'gain', 'bias', 'gamma') and isinstance(v, str):
+                v = [item.strip() for item in v.split(',')]
+            if isinstance(v, (list, tuple)):
+                v = [float(item) if isinstance(item, int) else item for item in v]
+            elif isinstance(v, int) and not isinstance(v, bool):
+                v = float(v)
+            params[k] = v
+
+        payload = ee_object.serialize() + json.dumps(params, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """Retrieves a cached map ID.
+
+        Args:
+            key (str): The cache key returned by MapIdCache.key().
+
+        Returns:
+            dict: A dictionary containing the mapid and url_format, or None if the key is not cached or has expired.
+        """
+        import json
+        import time
+
+        value = self._memory.get(key)
+        if value is None and self.db_path is not None:
+            with self._connect() as conn:
+                row = conn.execute(
+                    'SELECT value, created FROM map_ids WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                if self.ttl is None or time.time() - row[1] <= self.ttl:
+                    value = json.loads(row[0])
+                    self._memory.set(key, value, created=row[1])
+                else:
+                    self.invalidate(key)
+
+        with self._stats_lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value):
+        """Adds a map ID to the cache.
+
+        Args:
+            key (str): The cache key returned by MapIdCache.key().
+            value (dict): A dictionary containing the mapid and url_format.
+        """
+        import json
+        import time
+
+        created = time.time()
+        self._memory.set(key, value, created=created)
+        if self.db_path is not None:
+            with self._connect() as conn:
+                conn.execute('INSERT OR REPLACE INTO map_ids VALUES (?, ?, ?)',
+                             (key, json.dumps(value), created))
+
+    def invalidate(self, key=None):
+        """Removes a single entry, or all entries if no key is given, from the cache.
+
+        Args:
+            key (str, optional): The cache key to remove. Defaults to None.
+        """
+        if key is None:
+            self._memory.clear()
+        else:
+            self._memory.pop(key)
+
+        if self.db_path is not None:
+            with self._connect() as conn:
+                if key is None:
+                    conn.execute('DELETE FROM map_ids')
+                else:
+                    conn.execute('DELETE FROM map_ids WHERE key = ?', (key,))
+
+    def stats(self):
+        """Returns the cache hit and miss counters.
+
+        Returns:
+            dict: A dictionary containing hits, misses, and the number of entries in memory.
+        """
+        with self._stats_lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._memory)}
+
+
+# The cache shared by all Map instances unless another one is given.
+map_id_cache = MapIdCache()
+
+
+def get_map_id(ee_object, vis_params={}, cache=None):
+    """Gets the map ID of an ee.Image, reusing a cached one when available.
+
+    Args:
+        ee_object (object): The ee.Image to visualize.
+        vis_params (dict, optional): The visualization parameters. Defaults to {}.
+        cache (MapIdCache, optional): The cache to use. Defaults to None, which always requests a new map ID.
+
+    Returns:
+        dict: A dictionary containing the mapid and url_format of the tile layer.
+    """
+    key = None
+    if cache is not None:
+        key = MapIdCache.key(ee_object, vis_params)
+        map_id = cache.get(key)
+        if map_id is not None:
+            return map_id
+
+    map_id_dict = ee.Image(ee_object).getMapId(vis_params)
+    map_id = {
+        'mapid': map_id_dict['mapid'],
+        'url_format': map_id_dict['tile_fetcher'].url_format,
+    }
+
+    if cache is not None:
+        cache.set(key, map_id)
+    return map_id
+
+
+########################################
+#           Batched getInfo            #
+########################################
+
+_get_info_stats = {'requests': 0, 'values': 0, 'saved': 0}
+_get_info_lock = threading.Lock()
+
+
+def batch_get_info(values, saved=None):
+    """Resolves several Earth Engine values with a single getInfo round trip instead of one per value.
+
+    Args:
+        values (dict|list): A dictionary or list of Earth Engine objects (e.g., ee.Number, ee.List, ee.Dictionary). Plain Python values are passed through.
+        saved (int, optional): The number of getInfo round trips saved by combining the values, as reported by get_info_stats(). Pass 0 when the values would otherwise have been fetched together anyway. Defaults to one fewer than the number of values.
+
+    Returns:
+        dict|list: The client-side values, in the same structure as the input.
+    """
+    if isinstance(values, dict):
+        result = ee.Dictionary(values).getInfo()
+    else:
+        result = ee.List(list(values)).getInfo()
+
+    if saved is None:
+        saved = max(len(values) - 1, 0)
+    with _get_info_lock:
+        _get_info_stats['requests'] += 1
+        _get_info_stats['values'] += len(values)
+        _get_info_stats['saved'] += saved
+    return result
+
+
+def get_info_stats(reset=False):
+    """Returns the number of getInfo round trips made and saved by batch_get_info().
+
+    Args:
+        reset (bool, optional): Whether to reset the counters after reading them. Defaults to False.
+
+    Returns:
+        dict: A dictionary containing requests (round trips made), values (values resolved), and saved (round trips saved).
+    """
+    with _get_info_lock:
+        stats = dict(_get_info_stats)
+        if reset:
+            for key in _get_info_stats:
+                _get_info_stats[key] = 0
+    return stats
+
+
 ########################################
 #           Data Download              #
 ########################################
@@ -489,6 +766,69 @@ def download_from_url(url, out_file_name=None, out_dir='.', unzip=True):
     print('Data downloaded to: {}'.format(final_path))
 
 
+def stream_download(url, filename=None, extract_dir=None, chunk_size=1024 * 1024, max_memory=64 * 1024 * 1024):
+    """Downloads a URL with large read buffers, optionally extracting a zip payload straight into a directory.
+
+    When extract_dir is given, the payload is buffered in memory (or in the local temp directory if it is larger than max_memory) and extracted from there, so the intermediate zip file is never written to the destination.
+
+    Args:
+        url (str): The HTTP URL to download.
+        filename (str, optional): The output file path. Required unless extract_dir is given. Defaults to None.
+        extract_dir (str, optional): The directory to extract a zip payload into. Defaults to None.
+        chunk_size (int, optional): The read buffer size in bytes. Defaults to 1 MB.
+        max_memory (int, optional): The payload size in bytes up to which a zip payload is kept in memory before extraction. Defaults to 64 MB.
+
+    Raises:
+        requests.HTTPError: If the server does not respond with HTTP 200.
+
+    Returns:
+        dict: A dictionary containing filename, files (the extracted file names), bytes, seconds, and throughput (bytes/s).
+    """
+    import requests
+    import tempfile
+    import time
+
+    if filename is None and extract_dir is None:
+        raise ValueError('Either filename or extract_dir must be given.')
+
+    start = time.time()
+    r = requests.get(url, stream=True)
+    if r.status_code != 200:
+        raise requests.HTTPError('HTTP {} while downloading {}'.format(r.status_code, url), response=r)
+
+    size = 0
+    files = []
+    if extract_dir is None:
+        filename = os.path.abspath(filename)
+        # write to a .part file first so that an interrupted download never looks complete
+        filename_part = filename + '.part'
+        with open(filename_part, 'wb') as fd:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                fd.write(chunk)
+                size += len(chunk)
+        os.replace(filename_part, filename)
+    else:
+        if not os.path.exists(extract_dir):
+            os.makedirs(extract_dir)
+        with tempfile.SpooledTemporaryFile(max_size=max_memory) as buffer:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                buffer.write(chunk)
+                size += len(chunk)
+            buffer.seek(0)
+            with zipfile.ZipFile(buffer) as z:
+                files = z.namelist()
+                z.extractall(extract_dir)
+
+    seconds = time.time() - start
+    return {
+        'filename': filename,
+        'files': files,
+        'bytes': size,
+        'seconds': seconds,
+        'throughput': size / seconds if seconds > 0 else float('inf'),
+    }
+
+
 def download_from_gdrive(gfile_url, file_name, out_dir='.', unzip=True):
     """Download a file shared via Google Drive 
        (e.g., https://drive.google.com/file/d/18SUo_HcDGltuWYZs1s7PpOmOq_FvFn04/view?usp=sharing)
@@ -518,17 +858,70 @@ def download_from_gdrive(gfile_url, file_name, out_dir='.', unzip=True):
 #           Data Conversion            #
 ########################################
 
-def xy_to_points(in_csv, latitude='latitude', longitude='longitude'):
+def _parse_csv_value(value):
+    """Converts a csv string to an int or float if possible."""
+    if value == '':
+        return None
+    for func in (int, float):
+        try:
+            return func(value)
+        except ValueError:
+            pass
+    return value
+
+
+def _read_xy_csv(in_csv, latitude, longitude, columns=[]):
+    """Reads the coordinate and attribute columns of a csv, with pandas if available.
+
+    Returns:
+        tuple: Numpy arrays of longitudes and latitudes (NaN where missing) and a list of values per attribute column.
+    """
+    import numpy as np
+
+    try:
+        import pandas as pd
+
+        df = pd.read_csv(in_csv, usecols=list(dict.fromkeys([longitude, latitude] + columns)))
+        lons = pd.to_numeric(df[longitude], errors='coerce').to_numpy(dtype=float)
+        lats = pd.to_numeric(df[latitude], errors='coerce').to_numpy(dtype=float)
+        values = [df[column].astype(object).where(df[column].notna(), None).tolist() for column in columns]
+
+    except ImportError:
+        with open(in_csv) as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader)
+            lon_index, lat_index = header.index(longitude), header.index(latitude)
+            indexes = [header.index(column) for column in columns]
+            rows = list(reader)
+
+        def to_float(value):
+            try:
+                return float(value)
+            except ValueError:
+                return np.nan
+
+        lons = np.fromiter((to_float(row[lon_index]) for row in rows), dtype=float, count=len(rows))
+        lats = np.fromiter((to_float(row[lat_index]) for row in rows), dtype=float, count=len(rows))
+        values = [[_parse_csv_value(row[index]) for row in rows] for index in indexes]
+
+    return lons, lats, values
+
+
+def xy_to_points(in_csv, latitude='latitude', longitude='longitude', columns=None, drop_duplicates=False, batch_size=5000):
     """Converts a csv containing points (latitude and longitude) into an ee.FeatureCollection.
 
     Args:
         in_csv (str): File path or HTTP URL to the input csv file. For example, https://raw.githubusercontent.com/giswqs/data/main/world/world_cities.csv
         latitude (str, optional): Column name for the latitude column. Defaults to 'latitude'.
         longitude (str, optional): Column name for the longitude column. Defaults to 'longitude'.
+        columns (list, optional): Columns to carry over as feature properties. Defaults to None.
+        drop_duplicates (bool, optional): Whether to keep only the first row of each coordinate pair. Defaults to False.
+        batch_size (int, optional): The number of points per ee.List literal. Batches are merged into one collection. Defaults to 5000.
 
     Returns:
         ee.FeatureCollection: The ee.FeatureCollection containing the points converted from the input csv.
     """
+    import numpy as np
 
     if in_csv.startswith('http') and in_csv.endswith('.csv'):
         out_dir = os.path.join(os.path.expanduser('~'), 'Downloads')
@@ -543,23 +936,143 @@ def xy_to_points(in_csv, latitude='latitude', longitude='longitude'):
     if not os.path.exists(in_csv):
         raise Exception('The provided csv file does not exist.')
 
-    points = []
-    with open(in_csv) as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            lat, lon = float(row[latitude]), float(row[longitude])
-            points.append([lon, lat])
+    if columns is None:
+        columns = []
+    elif isinstance(columns, str):
+        columns = [columns]
+
+    lons, lats, values = _read_xy_csv(in_csv, latitude, longitude, columns)
+
+    valid = np.isfinite(lons) & np.isfinite(lats) & (np.abs(lons) <= 180) & (np.abs(lats) <= 90)
+    if not valid.all():
+        print('Skipped {} rows with missing or invalid coordinates.'.format(int((~valid).sum())))
+    keep = np.flatnonzero(valid)
+
+    if drop_duplicates and len(keep):
+        _, first = np.unique(np.column_stack([lons[keep], lats[keep]]), axis=0, return_index=True)
+        if len(first) < len(keep):
+            print('Dropped {} rows with duplicate coordinates.'.format(len(keep) - len(first)))
+        keep = keep[np.sort(first)]
+
+    lons = lons[keep].tolist()
+    lats = lats[keep].tolist()
+    if columns:
+        keep = keep.tolist()
+        values = [[column_values[i] for i in keep] for column_values in values]
+        points = [list(row) for row in zip(lons, lats, *values)]
+
+        def to_feature(row):
+            row = ee.List(row)
+            return ee.Feature(ee.Geometry.Point(row.slice(0, 2)), ee.Dictionary.fromLists(columns, row.slice(2)))
+    else:
+        points = [list(row) for row in zip(lons, lats)]
+
+        def to_feature(xy):
+            return ee.Feature(ee.Geometry.Point(xy))
+
+    batches = [ee.FeatureCollection(ee.List(points[i:i + batch_size]).map(to_feature))
+               for i in range(0, max(len(points), 1), batch_size)]
+    if len(batches) == 1:
+        return batches[0]
+    return ee.FeatureCollection(batches).flatten()
+
+
+def _rdp_mask(points, tolerance):
+    """Finds the points kept by the Ramer-Douglas-Peucker simplification of a line.
+
+    Args:
+        points (numpy.ndarray): An (n, 2) array of points.
+        tolerance (float): The maximum distance between the original and the simplified line.
 
-    ee_list = ee.List(points)
-    ee_points = ee_list.map(lambda xy: ee.Feature(ee.Geometry.Point(xy)))
-    return ee.FeatureCollection(ee_points)
+    Returns:
+        numpy.ndarray: A boolean mask of the points to keep.
+    """
+    import numpy as np
+
+    keep = np.zeros(len(points), dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(points) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end <= start + 1:
+            continue
+        a, b = points[start], points[end]
+        inner = points[start + 1:end]
+        dx, dy = b - a
+        length = math.hypot(dx, dy)
+        if length == 0:
+            dist = np.hypot(inner[:, 0] - a[0], inner[:, 1] - a[1])
+        else:
+            dist = np.abs(dx * (inner[:, 1] - a[1]) - dy * (inner[:, 0] - a[0])) / length
+        index = int(dist.argmax())
+        if dist[index] > tolerance:
+            index += start + 1
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return keep
+
+
+def _simplify_coordinates(coords, depth, tolerance=None, precision=None, min_points=2):
+    """Simplifies and rounds nested GeoJSON coordinates. Lines with fewer than min_points left are not simplified."""
+    import numpy as np
 
+    if depth > 1:
+        return [_simplify_coordinates(c, depth - 1, tolerance, precision, min_points) for c in coords]
 
-def geojson_to_ee(geo_json, geodesic=True):
+    points = np.asarray(coords, dtype=float)
+    if depth == 1 and tolerance and len(points) > min_points:
+        keep = _rdp_mask(points[:, :2], tolerance)
+        if keep.sum() >= min_points:
+            points = points[keep]
+    if precision is not None:
+        points = points.round(precision)
+    return points.tolist()
+
+
+def simplify_geojson(geometry, tolerance=None, precision=None):
+    """Simplifies the lines and rings of a GeoJSON with the Ramer-Douglas-Peucker algorithm and rounds its coordinates. The input is not modified.
+
+    Args:
+        geometry (dict): A GeoJSON geometry, GeometryCollection, Feature, or FeatureCollection.
+        tolerance (float, optional): The simplification tolerance in coordinate units (degrees for EPSG:4326). Defaults to None, which does not simplify.
+        precision (int, optional): The number of decimal places to round coordinates to. Defaults to None, which does not round.
+
+    Returns:
+        dict: The simplified GeoJSON.
+    """
+    if geometry is None:
+        return None
+    elif 'features' in geometry:
+        geometry = dict(geometry)
+        geometry['features'] = [simplify_geojson(
+            feature, tolerance, precision) for feature in geometry['features']]
+    elif 'geometry' in geometry:
+        geometry = dict(geometry)
+        geometry['geometry'] = simplify_geojson(geometry['geometry'], tolerance, precision)
+    elif 'geometries' in geometry:
+        geometry = dict(geometry)
+        geometry['geometries'] = [simplify_geojson(
+            item, tolerance, precision) for item in geometry['geometries']]
+    elif geometry.get('type') in _GEOMETRY_DEPTHS:
+        geometry = dict(geometry)
+        geom_type = geometry['type']
+        min_points = 4 if geom_type in ('Polygon', 'MultiPolygon') else 2
+        if geom_type == 'MultiPoint':
+            tolerance = None
+        geometry['coordinates'] = _simplify_coordinates(
+            geometry['coordinates'], _GEOMETRY_DEPTHS[geom_type], tolerance, precision, min_points)
+    return geometry
+
+
+def geojson_to_ee(geo_json, geodesic=True, tolerance=None, precision=None):
     """Converts a geojson to ee.Geometry()
 
     Args:
         geo_json (dict): A geojson geometry dictionary or file path.
+        geodesic (bool, optional): Whether line segments are interpreted as spherical geodesics. Defaults to True.
+        tolerance (float, optional): For a FeatureCollection, the tolerance to simplify features with before converting them. See simplify_geojson(). Defaults to None.
+        precision (int, optional): For a FeatureCollection, the number of decimal places to round coordinates to. Defaults to None.
 
     Returns:
         ee_object: An ee.Geometry object
@@ -575,8 +1088,10 @@ def geojson_to_ee(geo_json, geodesic=True):
                 geo_json = json.load(f)
 
         if geo_json['type'] == 'FeatureCollection':
-            features = ee.FeatureCollection(geo_json['features'])
-            return features
+            if tolerance is None and precision is None:
+                features = ee.FeatureCollection(geo_json['features'])
+                return features
+            return _features_to_ee_simplified(geo_json['features'], tolerance, precision)
         elif geo_json['type'] == 'Feature':
             geom = None
             keys = geo_json['properties']['style'].keys()
@@ -600,29 +1115,48 @@ def geojson_to_ee(geo_json, geodesic=True):
         print(e)
 
 
-def ee_to_geojson(ee_object, out_json=None):
+def _features_to_ee_simplified(features, tolerance=None, precision=None):
+    """Simplifies and rounds GeoJSON features before converting them to an ee.FeatureCollection, and reports how much smaller their serialized size is. See geojson_to_ee() for the arguments."""
+    import json
+
+    def size(feature):
+        return len(json.dumps(feature, separators=(',', ':')))
+
+    size_before = sum(size(feature) for feature in features)
+    features = [simplify_geojson(feature, tolerance, precision) for feature in features]
+    size_after = sum(size(feature) for feature in features)
+
+    print('Serialized features: {:,.1f} KB -> {:,.1f} KB'.format(
+        size_before / 1024, size_after / 1024))
+
+    return ee.FeatureCollection(features)
+
+
+def ee_to_geojson(ee_object, out_json=None, precision=None, compress=None):
     """Converts Earth Engine object to geojson.
 
     Args:
         ee_object (object): An Earth Engine object.
+        out_json (str, optional): File path to an output GeoJSON file. The object is written as a FeatureCollection, one compact feature at a time. Defaults to None.
+        precision (int, optional): The number of decimal places to round coordinates to in the output file. Defaults to None.
+        compress (bool, optional): Whether to gzip the output file. Defaults to None, which compresses it if out_json ends with .gz.
 
     Returns:
         object: GeoJSON object.
     """
-    from json import dumps
     # ee_initialize()
 
     try:
         if isinstance(ee_object, ee.geometry.Geometry) or isinstance(ee_object, ee.feature.Feature) or isinstance(ee_object, ee.featurecollection.FeatureCollection):
             json_object = ee_object.getInfo()
             if out_json is not None:
-                out_json = os.path.abspath(out_json)
-                if not os.path.exists(os.path.dirname(out_json)):
-                    os.makedirs(os.path.dirname(out_json))
-                geojson = open(out_json, "w")
-                geojson.write(
-                    dumps({"type": "FeatureCollection", "features": json_object}, indent=2) + "\n")
-                geojson.close()
+                if json_object.get('type') == 'FeatureCollection':
+                    features = json_object['features']
+                elif json_object.get('type') == 'Feature':
+                    features = [json_object]
+                else:
+                    features = [{'type': 'Feature', 'geometry': json_object, 'properties': {}}]
+                _write_geojson_features(features, out_json, precision=precision, compress=compress)
             return json_object
         else:
             print("Could not convert the Earth Engine object to geojson")
@@ -630,21 +1164,159 @@ def ee_to_geojson(ee_object, out_json=None):
         print(e)
 
 
-def shp_to_geojson(in_shp, out_json=None):
-    """Converts a shapefile to GeoJSON.
+def iter_ee_features(ee_object, page_size=1000, max_workers=1):
+    """Pulls the features of an ee.FeatureCollection in pages of a fixed size and yields them one at a time, so that collections larger than the getInfo() limit can be read with bounded memory.
+
+    Args:
+        ee_object (object): An ee.FeatureCollection.
+        page_size (int, optional): The number of features requested at a time. Defaults to 1000.
+        max_workers (int, optional): The maximum number of pages requested at the same time. At most this many pages are held in memory. Defaults to 1.
+
+    Yields:
+        dict: A GeoJSON Feature.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not isinstance(ee_object, ee.FeatureCollection):
+        raise ValueError('ee_object must be an ee.FeatureCollection')
+
+    count = ee_object.size().getInfo()
+    offsets = iter(range(0, count, page_size))
+
+    def get_page(offset):
+        return ee_object.toList(page_size, offset).getInfo()
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        pages = deque(executor.submit(get_page, offset)
+                      for offset in itertools.islice(offsets, max(1, max_workers)))
+        while pages:
+            page = pages.popleft().result()
+            for offset in itertools.islice(offsets, 1):
+                pages.append(executor.submit(get_page, offset))
+            for feature in page:
+                yield feature
+
+
+def _write_geojson_features(features, out_file, ndjson=False, precision=None, compress=None):
+    """Writes GeoJSON features to a file one at a time with compact separators, as a FeatureCollection or as newline-delimited GeoJSON.
+
+    Args:
+        features (iterable): GeoJSON Feature dicts.
+        out_file (str): File path to the output file.
+        ndjson (bool, optional): Whether to write one feature per line instead of a FeatureCollection. Defaults to False.
+        precision (int, optional): The number of decimal places to round coordinates to. Defaults to None.
+        compress (bool, optional): Whether to gzip the file. Defaults to None, which compresses it if out_file ends with .gz.
+
+    Returns:
+        int: The number of features written.
+    """
+    import gzip
+    import json
+
+    out_file = os.path.abspath(out_file)
+    if not os.path.exists(os.path.dirname(out_file)):
+        os.makedirs(os.path.dirname(out_file))
+
+    if compress is None:
+        compress = out_file.lower().endswith('.gz')
+
+    count = 0
+    with (gzip.open(out_file, 'wt') if compress else open(out_file, 'w')) as f:
+        if not ndjson:
+            f.write('{"type":"FeatureCollection","features":[\n')
+        for feature in features:
+            if count and not ndjson:
+                f.write(',\n')
+            if precision is not None:
+                feature = simplify_geojson(feature, precision=precision)
+            f.write(json.dumps(feature, separators=(',', ':')))
+            if ndjson:
+                f.write('\n')
+            count += 1
+        if not ndjson:
+            f.write('\n]}\n')
+    return count
+
+
+def ee_to_geojson_stream(ee_object, out_file, page_size=1000, max_workers=4, ndjson=None, precision=None, compress=None):
+    """Downloads an ee.FeatureCollection of any size to a GeoJSON or newline-delimited GeoJSON file, page by page.
+
+    Args:
+        ee_object (object): An ee.FeatureCollection.
+        out_file (str): File path to the output file.
+        page_size (int, optional): The number of features requested at a time. Defaults to 1000.
+        max_workers (int, optional): The maximum number of pages requested at the same time. Defaults to 4.
+        ndjson (bool, optional): Whether to write one feature per line. Defaults to None, which writes newline-delimited GeoJSON if out_file ends with .ndjson, .geojsonl, or .jsonl (optionally followed by .gz).
+        precision (int, optional): The number of decimal places to round coordinates to. Defaults to None.
+        compress (bool, optional): Whether to gzip the output file. Defaults to None, which compresses it if out_file ends with .gz.
+
+    Returns:
+        int: The number of features written.
+    """
+    if ndjson is None:
+        name = out_file.lower()
+        if name.endswith('.gz'):
+            name = name[:-len('.gz')]
+        ndjson = name.endswith(('.ndjson', '.geojsonl', '.jsonl'))
+    features = iter_ee_features(ee_object, page_size, max_workers)
+    count = _write_geojson_features(features, out_file, ndjson, precision, compress)
+    print('{} features written to {}'.format(count, os.path.abspath(out_file)))
+    return count
+
+
+def _coords_to_lists(coords):
+    """Converts nested coordinate tuples to lists, as returned by json.load()."""
+    if coords and isinstance(coords[0], (list, tuple)):
+        return [_coords_to_lists(c) for c in coords]
+    return list(coords)
+
+
+def iter_shp_features(in_shp):
+    """Reads a shapefile one record at a time and yields GeoJSON features.
+
+    Args:
+        in_shp (str): File path of the input shapefile.
+
+    Yields:
+        dict: A GeoJSON Feature. Date fields are converted to ISO 8601 strings.
+    """
+    import datetime
+    import shapefile
+
+    with shapefile.Reader(os.path.abspath(in_shp)) as reader:
+        fields = reader.fields[1:]
+        field_names = [field[0] for field in fields]
+        for sr in reader.iterShapeRecords():
+            atr = dict(zip(field_names, sr.record))
+            for key, value in atr.items():
+                if isinstance(value, datetime.date):
+                    atr[key] = value.isoformat()
+            geom = sr.shape.__geo_interface__
+            if 'coordinates' in geom:
+                geom['coordinates'] = _coords_to_lists(geom['coordinates'])
+            elif 'geometries' in geom:
+                for item in geom['geometries']:
+                    item['coordinates'] = _coords_to_lists(item['coordinates'])
+            yield dict(type="Feature", geometry=geom, properties=atr)
+
+
+def shp_to_geojson(in_shp, out_json=None, indent=None, return_features=True):
+    """Converts a shapefile to GeoJSON. Features are written to the output file as they are read, and the file only replaces out_json once it is complete.
 
     Args:
         in_shp (str): File path of the input shapefile.
         out_json (str, optional): File path of the output GeoJSON. Defaults to None.
+        indent (int, optional): The indentation of the output GeoJSON. Defaults to None, which writes compact JSON.
+        return_features (bool, optional): Whether to keep all features in memory and return them as a FeatureCollection. For large shapefiles, set it to False to get a generator that reads the features from the shapefile again one at a time (see iter_shp_features()). Defaults to True.
 
     Returns:
-        object: The json object representing the shapefile.
+        object: The json object representing the shapefile, or a generator of GeoJSON features if return_features is False.
     """
     # check_install('pyshp')
     # ee_initialize()
     try:
         import json
-        import shapefile
         in_shp = os.path.abspath(in_shp)
 
         if out_json is None:
@@ -656,35 +1328,44 @@ def shp_to_geojson(in_shp, out_json=None):
         elif not os.path.exists(os.path.dirname(out_json)):
             os.makedirs(os.path.dirname(out_json))
 
-        reader = shapefile.Reader(in_shp)
-        fields = reader.fields[1:]
-        field_names = [field[0] for field in fields]
-        buffer = []
-        for sr in reader.shapeRecords():
-            atr = dict(zip(field_names, sr.record))
-            geom = sr.shape.__geo_interface__
-            buffer.append(dict(type="Feature", geometry=geom, properties=atr))
-
-        from json import dumps
-        geojson = open(out_json, "w")
-        geojson.write(dumps({"type": "FeatureCollection",
-                             "features": buffer}, indent=2) + "\n")
-        geojson.close()
-
-        with open(out_json) as f:
-            json_data = json.load(f)
+        if indent is None:
+            separators = (',', ':')
+        else:
+            separators = (',', ': ')
 
-        return json_data
+        features = []
+        tmp_json = out_json + '.part'
+        try:
+            with open(tmp_json, "w") as geojson:
+                geojson.write('{"type":"FeatureCollection","features":[\n')
+                for i, feature in enumerate(iter_shp_features(in_shp)):
+                    if i:
+                        geojson.write(',\n')
+                    json.dump(feature, geojson, indent=indent, separators=separators)
+                    if return_features:
+                        features.append(feature)
+                geojson.write('\n]}\n')
+            os.replace(tmp_json, out_json)
+        except BaseException:
+            if os.path.exists(tmp_json):
+                os.remove(tmp_json)
+            raise
+
+        if not return_features:
+            return iter_shp_features(in_shp)
+        return {"type": "FeatureCollection", "features": features}
 
     except Exception as e:
         print(e)
 
 
-def shp_to_ee(in_shp):
+def shp_to_ee(in_shp, tolerance=None, precision=None):
     """Converts a shapefile to Earth Engine objects. Note that the CRS of the shapefile must be EPSG:4326
 
     Args:
         in_shp (str): File path to a shapefile.
+        tolerance (float, optional): The tolerance in degrees to simplify features with. Defaults to None.
+        precision (int, optional): The number of decimal places to round coordinates to. Defaults to None.
 
     Returns:
         object: Earth Engine objects representing the shapefile.
@@ -692,12 +1373,209 @@ def shp_to_ee(in_shp):
     # ee_initialize()
     try:
         json_data = shp_to_geojson(in_shp)
-        ee_object = geojson_to_ee(json_data)
+        ee_object = geojson_to_ee(json_data, tolerance=tolerance, precision=precision)
         return ee_object
     except Exception as e:
         print(e)
 
 
+def _geojson_to_wkb(geometry):
+    """Encodes a GeoJSON geometry as 2D little-endian Well-Known Binary (WKB).
+
+    Args:
+        geometry (dict): A GeoJSON geometry.
+
+    Returns:
+        bytes: The WKB representation of the geometry.
+    """
+    import struct
+
+    wkb_types = {'Point': 1, 'LineString': 2, 'Polygon': 3, 'MultiPoint': 4,
+                 'MultiLineString': 5, 'MultiPolygon': 6, 'GeometryCollection': 7}
+
+    def points(coords):
+        values = [value for point in coords for value in point[:2]]
+        return struct.pack('<I{}d'.format(len(values)), len(coords), *values)
+
+    def rings(coords):
+        return struct.pack('<I', len(coords)) + b''.join(points(ring) for ring in coords)
+
+    geom_type = geometry['type']
+    header = struct.pack('<BI', 1, wkb_types[geom_type])
+    coords = geometry.get('coordinates')
+    if geom_type == 'Point':
+        return header + struct.pack('<2d', *(coords[:2] if coords else [float('nan')] * 2))
+    elif geom_type == 'LineString':
+        return header + points(coords)
+    elif geom_type == 'Polygon':
+        return header + rings(coords)
+    elif geom_type == 'GeometryCollection':
+        parts = geometry['geometries']
+    else:
+        part_type = geom_type[len('Multi'):]
+        parts = [{'type': part_type, 'coordinates': part} for part in coords]
+    return header + struct.pack('<I', len(parts)) + b''.join(_geojson_to_wkb(part) for part in parts)
+
+
+def _iter_geojson_features(in_file, chunk_size=1024 * 1024):
+    """Reads a GeoJSON FeatureCollection file incrementally and yields its features one at a time, so that only one feature is held in memory.
+
+    Args:
+        in_file (str): File path to a GeoJSON FeatureCollection.
+        chunk_size (int, optional): The number of characters read at a time. Defaults to 1 MB.
+
+    Yields:
+        dict: A GeoJSON Feature.
+    """
+    import json
+
+    decoder = json.JSONDecoder()
+    state = {'buffer': '', 'pos': 0}
+
+    with open(in_file) as f:
+
+        def fill(size=chunk_size):
+            data = f.read(size)
+            state['buffer'] = state['buffer'][state['pos']:] + data
+            state['pos'] = 0
+            return bool(data)
+
+        def peek():
+            while True:
+                buffer, pos = state['buffer'], state['pos']
+                while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                    pos += 1
+                state['pos'] = pos
+                if pos < len(buffer):
+                    return buffer[pos]
+                if not fill():
+                    raise ValueError('Unexpected end of GeoJSON file {}'.format(in_file))
+
+        def expect(char):
+            if peek() != char:
+                raise ValueError('Invalid GeoJSON file {}: expected {!r}'.format(in_file, char))
+            state['pos'] += 1
+
+        def value():
+            while True:
+                peek()
+                try:
+                    obj, end = decoder.raw_decode(state['buffer'], state['pos'])
+                except json.JSONDecodeError:
+                    # the value continues past the buffer, read at least as much again
+                    if not fill(max(chunk_size, len(state['buffer']))):
+                        raise
+                    continue
+                if end == len(state['buffer']) and fill():
+                    # a number may continue in the next chunk
+                    continue
+                state['pos'] = end
+                return obj
+
+        expect('{')
+        while True:
+            char = peek()
+            if char == '}':
+                return
+            elif char == ',':
+                state['pos'] += 1
+                continue
+            key = value()
+            expect(':')
+            if key != 'features':
+                value()
+                continue
+            expect('[')
+            while True:
+                char = peek()
+                if char == ']':
+                    state['pos'] += 1
+                    break
+                elif char == ',':
+                    state['pos'] += 1
+                    continue
+                yield value()
+
+
+def _concat_arrow_tables(tables):
+    """Concatenates pyarrow tables, filling columns missing from some tables with nulls and promoting their types."""
+    import pyarrow as pa
+
+    try:
+        return pa.concat_tables(tables, promote_options='permissive')
+    except TypeError:
+        # pyarrow < 14
+        return pa.concat_tables(tables, promote=True)
+
+
+def vector_to_columnar(in_file, out_file, batch_size=10000):
+    """Converts a csv or GeoJSON file to a Parquet or Feather (Arrow IPC) file with pyarrow. Column types are inferred once during the conversion, and GeoJSON geometries are stored as WKB in a 'geometry' column with GeoParquet metadata.
+    GeoJSON features are read one at a time and converted in batches, and every property found in any feature becomes a column.
+
+    Args:
+        in_file (str): File path to the input csv or GeoJSON file.
+        out_file (str): File path to the output file, ending with .parquet, .feather, or .arrow. Feather files are written uncompressed so that they can be memory-mapped.
+        batch_size (int, optional): The number of GeoJSON features converted at a time. Defaults to 10000.
+    """
+    import json
+    import pyarrow as pa
+
+    in_file = os.path.abspath(in_file)
+    out_file = os.path.abspath(out_file)
+    filetype = os.path.splitext(out_file)[1][1:].lower()
+    if filetype not in ['parquet', 'feather', 'arrow']:
+        raise ValueError('The output file type must be parquet, feather, or arrow.')
+
+    if in_file.lower().endswith('.csv'):
+        from pyarrow import csv as pa_csv
+
+        table = pa_csv.read_csv(in_file, convert_options=pa_csv.ConvertOptions(strings_can_be_null=True))
+    else:
+        geo_types = set()
+
+        def to_table(features):
+            properties = [feature.get('properties') or {} for feature in features]
+            columns = {}
+            for key in dict.fromkeys(key for props in properties for key in props):
+                if key != 'geometry':
+                    columns[key] = [props.get(key) for props in properties]
+            geometries = [feature.get('geometry') for feature in features]
+            geo_types.update(geometry['type'] for geometry in geometries if geometry)
+            columns['geometry'] = pa.array([_geojson_to_wkb(geometry) if geometry else None
+                                            for geometry in geometries], type=pa.binary())
+            return pa.table(columns)
+
+        tables = []
+        batch = []
+        for feature in _iter_geojson_features(in_file):
+            batch.append(feature)
+            if len(batch) >= batch_size:
+                tables.append(to_table(batch))
+                batch = []
+        if batch or not tables:
+            tables.append(to_table(batch))
+
+        table = _concat_arrow_tables(tables)
+        names = [name for name in table.column_names if name != 'geometry']
+        table = table.select(names + ['geometry'])
+        geo = {'version': '1.0.0', 'primary_column': 'geometry',
+               'columns': {'geometry': {'encoding': 'WKB', 'geometry_types': sorted(geo_types)}}}
+        table = table.replace_schema_metadata({'geo': json.dumps(geo)})
+
+    out_dir = os.path.dirname(out_file)
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+
+    if filetype == 'parquet':
+        import pyarrow.parquet as pq
+
+        pq.write_table(table, out_file)
+    else:
+        import pyarrow.feather as feather
+
+        feather.write_feather(table, out_file, compression='uncompressed')
+
+
 ########################################
 #              Export Data             #
 ########################################
@@ -722,7 +1600,7 @@ def filter_polygons(ftr):
 
 
 def ee_export_vector(ee_object, filename, selectors=None):
-    """Exports Earth Engine FeatureCollection to other formats, including shp, csv, json, kml, and kmz.
+    """Exports Earth Engine FeatureCollection to other formats, including shp, csv, json, kml, kmz, parquet, and feather. Parquet and Feather files are converted from a GeoJSON download with vector_to_columnar(), which requires pyarrow.
 
     Args:
         ee_object (object): ee.FeatureCollection to export.
@@ -736,7 +1614,7 @@ def ee_export_vector(ee_object, filename, selectors=None):
     if not isinstance(ee_object, ee.FeatureCollection):
         raise ValueError('ee_object must be an ee.FeatureCollection')
 
-    allowed_formats = ['csv', 'geojson', 'kml', 'kmz', 'shp']
+    allowed_formats = ['csv', 'geojson', 'kml', 'kmz', 'shp', 'parquet', 'feather']
     # allowed_formats = ['csv', 'kml', 'kmz']
     filename = os.path.abspath(filename)
     basename = os.path.basename(filename)
@@ -752,6 +1630,19 @@ def ee_export_vector(ee_object, filename, selectors=None):
         print('Earth Engine no longer supports downloading featureCollection as shapefile or json. \nPlease use eefolium.ee_export_vector_to_drive() to export featureCollection to Google Drive.')
         raise ValueError
 
+    if filetype in ['parquet', 'feather']:
+        import tempfile
+
+        tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(filename))
+        try:
+            tmp_file = os.path.join(tmp_dir, name + '.geojson')
+            ee_export_vector(ee_object, tmp_file, selectors)
+            vector_to_columnar(tmp_file, filename)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        print('Data converted to {}'.format(filename))
+        return
+
     if selectors is None:
         selectors = ee_object.first().propertyNames().getInfo()
         if filetype == 'csv':
@@ -776,9 +1667,10 @@ def ee_export_vector(ee_object, filename, selectors=None):
         url = ee_object.getDownloadURL(
             filetype=filetype, selectors=selectors, filename=name)
         print('Downloading data from {}\nPlease wait ...'.format(url))
-        r = requests.get(url, stream=True)
-
-        if r.status_code != 200:
+        extract_dir = os.path.dirname(filename) if filetype == 'shp' else None
+        try:
+            stream_download(url, filename, extract_dir=extract_dir)
+        except requests.HTTPError:
             print('An error occurred while downloading. \n Retrying ...')
             try:
                 new_ee_object = ee_object.map(filter_polygons)
@@ -786,29 +1678,18 @@ def ee_export_vector(ee_object, filename, selectors=None):
                 url = new_ee_object.getDownloadURL(
                     filetype=filetype, selectors=selectors, filename=name)
                 print('Downloading data from {}\nPlease wait ...'.format(url))
-                r = requests.get(url, stream=True)
+                stream_download(url, filename, extract_dir=extract_dir)
             except Exception as e:
                 print(e)
                 raise ValueError
-
-        with open(filename, 'wb') as fd:
-            for chunk in r.iter_content(chunk_size=1024):
-                fd.write(chunk)
     except Exception as e:
         print('An error occurred while downloading.')
         raise ValueError(e)
 
-    try:
-        if filetype == 'shp':
-            z = zipfile.ZipFile(filename)
-            z.extractall(os.path.dirname(filename))
-            z.close()
-            os.remove(filename)
-            filename = filename.replace('.zip', '.shp')
+    if filetype == 'shp':
+        filename = filename.replace('.zip', '.shp')
 
-        print('Data downloaded to {}'.format(filename))
-    except Exception as e:
-        raise ValueError(e)
+    print('Data downloaded to {}'.format(filename))
 
 
 def ee_export_vector_to_drive(ee_object, description, folder, file_format='shp', selectors=None):
@@ -897,23 +1778,16 @@ def ee_export_geojson(ee_object, filename=None, selectors=None):
         url = ee_object.getDownloadURL(
             filetype=filetype, selectors=selectors, filename=name)
         # print('Downloading data from {}\nPlease wait ...'.format(url))
-        r = requests.get(url, stream=True)
-
-        if r.status_code != 200:
+        try:
+            stream_download(url, filename)
+        except requests.HTTPError:
             print('An error occurred while downloading. \n Retrying ...')
-            try:
-                new_ee_object = ee_object.map(filter_polygons)
-                print('Generating URL ...')
-                url = new_ee_object.getDownloadURL(
-                    filetype=filetype, selectors=selectors, filename=name)
-                print('Downloading data from {}\nPlease wait ...'.format(url))
-                r = requests.get(url, stream=True)
-            except Exception as e:
-                print(e)
-
-        with open(filename, 'wb') as fd:
-            for chunk in r.iter_content(chunk_size=1024):
-                fd.write(chunk)
+            new_ee_object = ee_object.map(filter_polygons)
+            print('Generating URL ...')
+            url = new_ee_object.getDownloadURL(
+                filetype=filetype, selectors=selectors, filename=name)
+            print('Downloading data from {}\nPlease wait ...'.format(url))
+            stream_download(url, filename)
     except Exception as e:
         print('An error occurred while downloading.')
         print(e)
@@ -965,12 +1839,32 @@ def ee_to_csv(ee_object, filename, selectors=None):
         print(e)
 
 
+def ee_to_parquet(ee_object, filename, selectors=None):
+    """Downloads an ee.FeatureCollection as a Parquet or Feather file, with geometries as WKB. Requires pyarrow.
+
+    Args:
+        ee_object (object): ee.FeatureCollection
+        filename (str): The output filepath of the Parquet (.parquet) or Feather (.feather) file.
+        selectors (list, optional): A list of attributes to export. Defaults to None.
+    """
+    # ee_initialize()
+    try:
+        if filename.lower().endswith(('.parquet', '.feather')):
+            ee_export_vector(ee_object=ee_object,
+                             filename=filename, selectors=selectors)
+        else:
+            print('The filename must end with .parquet or .feather')
+
+    except Exception as e:
+        print(e)
+
+
 def dict_to_csv(data_dict, out_csv, by_row=False):
     """Downloads an ee.Dictionary as a CSV file.
 
     Args:
         data_dict (ee.Dictionary): The input ee.Dictionary.
-        out_csv (str): The output file path to the CSV file.
+        out_csv (str): The output file path to the CSV file. It can also end with .parquet or .feather to write a columnar file.
         by_row (bool, optional): Whether to use by row or by column. Defaults to False.
     """
     import eefolium
@@ -991,19 +1885,266 @@ def dict_to_csv(data_dict, out_csv, by_row=False):
     ee_export_vector(csv_feat_col, out_csv)
 
 
-def ee_export_image(ee_object, filename, scale=None, crs=None, region=None, file_per_band=False):
+# Name of the JSON lines file recording completed downloads in an output directory.
+_EXPORT_MANIFEST = 'eefolium_manifest.jsonl'
+_export_manifest_lock = threading.Lock()
+
+
+def _file_md5(filename, chunk_size=1024 * 1024):
+    """Computes the MD5 checksum of a file."""
+    import hashlib
+
+    md5 = hashlib.md5()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _read_export_manifest(out_dir):
+    """Reads the export manifest of a directory.
+
+    Args:
+        out_dir (str): The output directory.
+
+    Returns:
+        dict: A dictionary mapping each completed output file name to its manifest record.
+    """
+    import json
+
+    records = {}
+    manifest = os.path.join(out_dir, _EXPORT_MANIFEST)
+    if os.path.exists(manifest):
+        with open(manifest) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    records[record['name']] = record
+                except ValueError:
+                    # ignore a line truncated by an interrupted run
+                    continue
+    return records
+
+
+def _is_export_complete(record, out_dir, verify=False):
+    """Checks whether all files listed in a manifest record still exist with the recorded sizes and, if verify is True, the recorded MD5 checksums."""
+    if record is None:
+        return False
+    for item in record['files']:
+        path = os.path.join(out_dir, item['file'])
+        if not os.path.exists(path) or os.path.getsize(path) != item['size']:
+            return False
+        if verify and _file_md5(path) != item.get('md5'):
+            return False
+    return True
+
+
+def _write_export_manifest(out_dir, name, files):
+    """Appends a record of a completed download to the export manifest of a directory.
+
+    Args:
+        out_dir (str): The output directory.
+        name (str): The output file name requested by the caller.
+        files (list): The names of the files written to out_dir.
+    """
+    import datetime
+    import json
+
+    record = {
+        'name': name,
+        'files': [{'file': f, 'size': os.path.getsize(os.path.join(out_dir, f)), 'md5': _file_md5(os.path.join(out_dir, f))} for f in files],
+        'time': datetime.datetime.now().isoformat(),
+    }
+    with _export_manifest_lock:
+        with open(os.path.join(out_dir, _EXPORT_MANIFEST), 'a') as f:
+            f.write(json.dumps(record) + '\n')
+
+
+def _retry(func, max_retries=2, backoff=0):
+    """Calls func(attempt) until it succeeds, re-raising the last exception once all retries have failed.
+
+    Args:
+        func (function): The function to call. It receives the number of the attempt, starting at 0, so that it can change its parameters for retries.
+        max_retries (int, optional): The number of times a failed call is retried. Defaults to 2.
+        backoff (float, optional): The number of seconds to wait before the first retry. The wait doubles after each failed attempt. Defaults to 0.
+
+    Returns:
+        object: The return value of func.
+    """
+    import time
+
+    for attempt in range(max_retries + 1):
+        try:
+            return func(attempt)
+        except Exception:
+            if attempt >= max_retries:
+                raise
+            if backoff:
+                time.sleep(backoff * 2 ** attempt)
+
+
+def _ee_download_image(ee_object, filename, scale=None, crs=None, region=None, file_per_band=False, verbose=True):
+    """Downloads an ee.Image as a GeoTIFF, raising an exception if anything fails. See ee_export_image() for the arguments.
+
+    Returns:
+        list: The names of the files extracted to the directory of filename.
+    """
+    import requests
+
+    filename = os.path.abspath(filename)
+    basename = os.path.basename(filename)
+    name = os.path.splitext(basename)[0]
+
+    if verbose:
+        print('Generating URL ...')
+    params = {'name': name, 'filePerBand': file_per_band}
+    if scale is None:
+        scale = ee_object.projection().nominalScale().multiply(10)
+    params['scale'] = scale
+    if region is None:
+        region = ee_object.geometry()
+    params['region'] = region
+    if crs is not None:
+        params['crs'] = crs
+
+    url = ee_object.getDownloadURL(params)
+    if verbose:
+        print('Downloading data from {}\nPlease wait ...'.format(url))
+    try:
+        result = stream_download(url, extract_dir=os.path.dirname(filename))
+    except requests.HTTPError as e:
+        raise ValueError('An error occurred while downloading {}. {}'.format(basename, e))
+    return result['files']
+
+
+def _mosaic_geotiffs(in_files, out_file):
+    """Mosaics GeoTIFFs into one GeoTIFF with rasterio, or GDAL if rasterio is not installed.
+
+    Args:
+        in_files (list): The input GeoTIFF file paths.
+        out_file (str): The output GeoTIFF file path.
+
+    Returns:
+        bool: Whether the mosaic was created.
+    """
+    try:
+        import rasterio
+        from rasterio.merge import merge
+
+        sources = [rasterio.open(f) for f in in_files]
+        try:
+            mosaic, transform = merge(sources)
+            profile = sources[0].profile.copy()
+        finally:
+            for src in sources:
+                src.close()
+        profile.update(driver='GTiff', height=mosaic.shape[1], width=mosaic.shape[2],
+                       transform=transform, tiled=True, compress='deflate', bigtiff='IF_SAFER')
+        with rasterio.open(out_file, 'w', **profile) as dst:
+            dst.write(mosaic)
+        return True
+    except ImportError:
+        pass
+
+    try:
+        from osgeo import gdal
+
+        vrt = gdal.BuildVRT('', in_files)
+        gdal.Translate(out_file, vrt, creationOptions=[
+                       'TILED=YES', 'COMPRESS=DEFLATE', 'BIGTIFF=IF_SAFER'])
+        vrt = None
+        return True
+    except ImportError:
+        return False
+
+
+def _ee_download_image_tiled(ee_object, filename, scale=None, crs=None, region=None, max_request_bytes=33554432, max_workers=4, max_retries=3, backoff=2.0):
+    """Downloads an ee.Image as a GeoTIFF, splitting the request into tiles when its estimated size exceeds the direct download limit. See ee_export_image() for the arguments.
+
+    Returns:
+        list: The names of the files written to the directory of filename.
+    """
+    import shutil
+    from concurrent.futures import ThreadPoolExecutor
+
+    filename = os.path.abspath(filename)
+    out_dir = os.path.dirname(filename)
+    name = os.path.splitext(os.path.basename(filename))[0]
+
+    if region is None:
+        region = ee_object.geometry()
+
+    grid = _ee_pixel_grid(ee_object, region, scale, crs)
+    dtype = _ee_band_types_to_dtype(grid['types'], grid['bands'])
+    bytes_per_pixel = dtype.itemsize * len(grid['bands'])
+    total_bytes = grid['width'] * grid['height'] * bytes_per_pixel
+
+    tile_size = max(int(math.sqrt(max_request_bytes / bytes_per_pixel)), 1)
+    windows = list(_grid_windows(grid['width'], grid['height'], tile_size, tile_size))
+    print('Estimated size: {:.1f} MB ({} x {} pixels, {} bands). Downloading {} tiles ...'.format(
+        total_bytes / 1024 ** 2, grid['width'], grid['height'], len(grid['bands']), len(windows)))
+
+    size = grid['pixel_size']
+    if len(windows) == 1:
+        tile_dir = out_dir
+    else:
+        tile_dir = os.path.join(out_dir, name + '_tiles')
+        if not os.path.exists(tile_dir):
+            os.makedirs(tile_dir)
+
+    def download(window):
+        col_off, row_off, width, height = window
+        # tiles share the grid of the whole image, so they line up exactly
+        params = {
+            'format': 'GEO_TIFF',
+            'crs': grid['crs'],
+            'crs_transform': [size, 0, (grid['col0'] + col_off) * size, 0, -size, -(grid['row0'] + row_off) * size],
+            'dimensions': [width, height],
+        }
+        if len(windows) == 1:
+            tile_file = filename
+        else:
+            tile_file = os.path.join(tile_dir, '{}_{}_{}.tif'.format(name, row_off, col_off))
+
+        def fetch(attempt):
+            stream_download(ee_object.getDownloadURL(params), tile_file)
+            return tile_file
+
+        return _retry(fetch, max_retries, backoff)
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        tile_files = list(executor.map(download, windows))
+
+    if len(windows) == 1:
+        return [os.path.basename(filename)]
+
+    print('Mosaicking {} tiles ...'.format(len(tile_files)))
+    if _mosaic_geotiffs(tile_files, filename):
+        shutil.rmtree(tile_dir)
+        return [os.path.basename(filename)]
+
+    print('Install rasterio or GDAL to mosaic the tiles. The tiles have been saved to {}'.format(tile_dir))
+    return [os.path.relpath(f, out_dir) for f in tile_files]
+
+
+def ee_export_image(ee_object, filename, scale=None, crs=None, region=None, file_per_band=False, resume=False, verify=False, tiled=False, max_request_bytes=33554432, max_workers=4, max_retries=3, backoff=2.0):
     """Exports an ee.Image as a GeoTIFF.
 
     Args:
         ee_object (object): The ee.Image to download.
         filename (str): Output filename for the exported image.
         scale (float, optional): A default scale to use for any bands that do not specify one; ignored if crs and crs_transform is specified. Defaults to None.
-        crs (str, optional): A default CRS string to use for any bands that do not explicitly specify one. Defaults to None.
+        crs (str, optional): A default CRS string to use for any bands that do not explicitly specify one. In tiled mode, the CRS of the output, which defaults to the CRS of the image's first band. Defaults to None.
         region (object, optional): A polygon specifying a region to download; ignored if crs and crs_transform is specified. Defaults to None.
         file_per_band (bool, optional): Whether to produce a different GeoTIFF per band. Defaults to False.
+        resume (bool, optional): Whether to record the download in a manifest file (eefolium_manifest.jsonl) in the output directory and skip the download if the manifest shows that it has already completed. Defaults to False.
+        verify (bool, optional): Whether resume also compares the MD5 checksum recorded in the manifest, which reads the whole file, instead of only its size. Defaults to False.
+        tiled (bool, optional): Whether to estimate the output size from the region, scale, and band types, split it into tiles under max_request_bytes, download the tiles concurrently, and mosaic them into filename with rasterio or GDAL. The scale defaults to the native resolution in this mode. Defaults to False.
+        max_request_bytes (int, optional): The maximum estimated size of each tile in tiled mode. Defaults to 32 MB.
+        max_workers (int, optional): The maximum number of tiles downloaded at the same time in tiled mode. Defaults to 4.
+        max_retries (int, optional): The number of times a failed tile is retried in tiled mode. Defaults to 3.
+        backoff (float, optional): The number of seconds to wait before the first retry of a tile. The wait doubles after each failed attempt. Defaults to 2.0.
     """
-    import requests
-    import zipfile
     # ee_initialize()
 
     if not isinstance(ee_object, ee.Image):
@@ -1012,59 +2153,43 @@ def ee_export_image(ee_object, filename, scale=None, crs=None, region=None, file
 
     filename = os.path.abspath(filename)
     basename = os.path.basename(filename)
-    name = os.path.splitext(basename)[0]
+    out_dir = os.path.dirname(filename)
     filetype = os.path.splitext(basename)[1][1:].lower()
-    filename_zip = filename.replace('.tif', '.zip')
 
     if filetype != 'tif':
         print('The filename must end with .tif')
         return
 
-    try:
-        print('Generating URL ...')
-        params = {'name': name, 'filePerBand': file_per_band}
-        if scale is None:
-            scale = ee_object.projection().nominalScale().multiply(10)
-        params['scale'] = scale
-        if region is None:
-            region = ee_object.geometry()
-        params['region'] = region
-        if crs is not None:
-            params['crs'] = crs
-
-        url = ee_object.getDownloadURL(params)
-        print('Downloading data from {}\nPlease wait ...'.format(url))
-        r = requests.get(url, stream=True)
-
-        if r.status_code != 200:
-            print('An error occurred while downloading.')
-            return
-
-        with open(filename_zip, 'wb') as fd:
-            for chunk in r.iter_content(chunk_size=1024):
-                fd.write(chunk)
+    if resume and _is_export_complete(_read_export_manifest(out_dir).get(basename), out_dir, verify):
+        print('{} has already been downloaded. Skipping ...'.format(basename))
+        return
 
-    except Exception as e:
-        print('An error occurred while downloading.')
-        print(e)
+    if tiled and file_per_band:
+        print('file_per_band is not supported in tiled mode.')
         return
 
     try:
-        z = zipfile.ZipFile(filename_zip)
-        z.extractall(os.path.dirname(filename))
-        z.close()
-        os.remove(filename_zip)
+        if tiled:
+            files = _ee_download_image_tiled(ee_object, filename, scale=scale, crs=crs, region=region,
+                                             max_request_bytes=max_request_bytes, max_workers=max_workers,
+                                             max_retries=max_retries, backoff=backoff)
+        else:
+            files = _ee_download_image(ee_object, filename, scale=scale, crs=crs,
+                                       region=region, file_per_band=file_per_band)
+        if resume:
+            _write_export_manifest(out_dir, basename, files)
 
-        if file_per_band:
+        if file_per_band or not os.path.exists(filename):
             print('Data downloaded to {}'.format(os.path.dirname(filename)))
         else:
             print('Data downloaded to {}'.format(filename))
     except Exception as e:
+        print('An error occurred while downloading.')
         print(e)
 
 
-def ee_export_image_collection(ee_object, out_dir, scale=None, crs=None, region=None, file_per_band=False):
-    """Exports an ImageCollection as GeoTIFFs.
+def ee_export_image_collection(ee_object, out_dir, scale=None, crs=None, region=None, file_per_band=False, max_workers=4, max_retries=3, backoff=2.0, resume=True, verify=False):
+    """Exports an ImageCollection as GeoTIFFs. Images are downloaded concurrently.
 
     Args:
         ee_object (object): The ee.Image to download.
@@ -1073,10 +2198,19 @@ def ee_export_image_collection(ee_object, out_dir, scale=None, crs=None, region=
         crs (str, optional): A default CRS string to use for any bands that do not explicitly specify one. Defaults to None.
         region (object, optional): A polygon specifying a region to download; ignored if crs and crs_transform is specified. Defaults to None.
         file_per_band (bool, optional): Whether to produce a different GeoTIFF per band. Defaults to False.
-    """
+        max_workers (int, optional): The maximum number of images downloaded at the same time. Defaults to 4.
+        max_retries (int, optional): The number of times a failed image is retried. Defaults to 3.
+        backoff (float, optional): The number of seconds to wait before the first retry. The wait doubles after each failed attempt. Defaults to 2.0.
+        resume (bool, optional): Whether to record completed images in a manifest file (eefolium_manifest.jsonl) in out_dir and skip the images it lists when the export is run again. Defaults to True.
+        verify (bool, optional): Whether resume also compares the MD5 checksums recorded in the manifest, which reads every completed file, instead of only their sizes. Defaults to False.
 
-    import requests
-    import zipfile
+    Raises:
+        ee.ee_exception.EEException: If the list of images cannot be retrieved.
+
+    Returns:
+        dict: A dictionary mapping the system:index of each image that could not be downloaded to its error.
+    """
+    from concurrent.futures import ThreadPoolExecutor
     # ee_initialize()
 
     if not isinstance(ee_object, ee.ImageCollection):
@@ -1086,22 +2220,47 @@ def ee_export_image_collection(ee_object, out_dir, scale=None, crs=None, region=
     if not os.path.exists(out_dir):
         os.makedirs(out_dir)
 
-    try:
+    indexes = ee_object.aggregate_array('system:index').getInfo()
+    count = len(indexes)
+    print("Total number of images: {}\n".format(count))
+
+    out_dir = os.path.abspath(out_dir)
+    if resume:
+        manifest = _read_export_manifest(out_dir)
+        done = set(index for index in indexes if _is_export_complete(
+            manifest.get(index + '.tif'), out_dir, verify))
+        if done:
+            print('Skipping {} images downloaded by a previous run.\n'.format(len(done)))
+            indexes = [index for index in indexes if index not in done]
+        count = len(indexes)
+
+    def export(index):
+        image = ee.Image(ee_object.filter(
+            ee.Filter.eq('system:index', index)).first())
+        filename = os.path.join(out_dir, index + '.tif')
+
+        def download(attempt):
+            return _ee_download_image(image, filename=filename, scale=scale, crs=crs,
+                                      region=region, file_per_band=file_per_band, verbose=False)
 
-        count = int(ee_object.size().getInfo())
-        print("Total number of images: {}\n".format(count))
+        try:
+            files = _retry(download, max_retries, backoff)
+        except Exception as e:
+            return e
+        if resume:
+            _write_export_manifest(out_dir, index + '.tif', files)
+        return None
 
-        for i in range(0, count):
-            image = ee.Image(ee_object.toList(count).get(i))
-            name = image.get('system:index').getInfo() + '.tif'
-            filename = os.path.join(os.path.abspath(out_dir), name)
-            print('Exporting {}/{}: {}'.format(i+1, count, name))
-            ee_export_image(image, filename=filename, scale=scale,
-                            crs=crs, region=region, file_per_band=file_per_band)
-            print('\n')
+    errors = {}
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        for i, (index, error) in enumerate(zip(indexes, executor.map(export, indexes))):
+            if error is None:
+                print('Exported {}/{}: {}.tif'.format(i + 1, count, index))
+            else:
+                errors[index] = error
+                print('Failed to export {}/{}: {}.tif\n{}'.format(i + 1, count, index, error))
 
-    except Exception as e:
-        print(e)
+    return errors
 
 
 def ee_export_image_to_drive(ee_object, description, folder=None, region=None, scale=None, crs=None, max_pixels=1.0E13, file_format='GeoTIFF', format_options={}):
@@ -1169,38 +2328,162 @@ def ee_export_image_collection_to_drive(ee_object, descriptions=None, folder=Non
         print('The ee_object must be an ee.ImageCollection.')
         return
 
-    try:
-        count = int(ee_object.size().getInfo())
-        print("Total number of images: {}\n".format(count))
+    try:
+        # the image names used to be fetched separately only when no descriptions were given
+        info = batch_get_info({
+            'count': ee_object.size(),
+            'indexes': ee_object.aggregate_array('system:index'),
+        }, saved=int(descriptions is None))
+        count = int(info['count'])
+        print("Total number of images: {}\n".format(count))
+
+        if (descriptions is not None) and (len(descriptions) != count):
+            print('The number of descriptions is not equal to the number of images.')
+            return
+
+        if descriptions is None:
+            descriptions = info['indexes']
+
+        images = ee_object.toList(count)
+
+        for i in range(0, count):
+            image = ee.Image(images.get(i))
+            name = descriptions[i]
+            ee_export_image_to_drive(
+                image, name, folder, region, scale, crs, max_pixels, file_format, format_options)
+
+    except Exception as e:
+        print(e)
+
+
+def _ee_band_types_to_dtype(band_types, bands=None, default_value=None):
+    """Finds the numpy dtype able to hold all bands of an image.
+
+    Args:
+        band_types (dict): The band types returned by ee.Image.bandTypes().getInfo().
+        bands (list, optional): The band names to consider. Defaults to all bands.
+        default_value (float, optional): The value used for masked pixels, which must also fit in the dtype. Defaults to None.
+
+    Returns:
+        numpy.dtype: The numpy dtype.
+    """
+    import numpy as np
+
+    if bands is None:
+        bands = list(band_types.keys())
+
+    dtypes = []
+    for band in bands:
+        band_type = band_types[band]
+        precision = band_type.get('precision')
+        if precision == 'int':
+            band_min = band_type.get('min', -2 ** 63)
+            band_max = band_type.get('max', 2 ** 63 - 1)
+            for dtype in [np.uint8, np.int8, np.uint16, np.int16, np.uint32, np.int32, np.int64]:
+                info = np.iinfo(dtype)
+                if info.min <= band_min and band_max <= info.max:
+                    break
+            dtypes.append(dtype)
+        elif precision == 'float':
+            dtypes.append(np.float32)
+        else:
+            dtypes.append(np.float64)
+
+    if default_value is not None:
+        if float(default_value).is_integer():
+            dtypes.append(np.min_scalar_type(int(default_value)))
+        else:
+            dtypes.append(np.float64)
+
+    return np.result_type(*dtypes)
+
+
+def _ee_pixel_grid(ee_object, region, scale=None, crs=None):
+    """Computes a north-up pixel grid covering a region at a given scale with a single getInfo call.
+
+    Args:
+        ee_object (object): The ee.Image to be gridded.
+        region (object): The ee.Geometry whose bounding box is covered by the grid.
+        scale (float, optional): The pixel size in meters. Defaults to the nominal scale of the image's first band.
+        crs (str, optional): The CRS of the grid. Defaults to the CRS of the image's first band.
+
+    Returns:
+        dict: A dictionary containing crs, crs_transform, pixel_size, col0, row0, width, height, bands, and types.
+    """
+    if scale is None:
+        scale = image_scale(ee_object)
+    if crs is None:
+        crs = ee_object.select(0).projection().crs()
+    proj = ee.Projection(crs)
+
+    info = batch_get_info({
+        'crs': proj.crs(),
+        'proj': proj.atScale(scale),
+        'bounds': ee.Geometry(region).bounds(1, proj).coordinates(),
+        'bands': ee_object.bandNames(),
+        'types': ee_object.bandTypes(),
+    }, saved=0)
+
+    # pixel (col, row) covers x in [col, col + 1) * size and y in (-row - 1, -row] * size
+    size = abs(info['proj']['transform'][0])
+    ring = info['bounds'][0]
+    xs = [xy[0] for xy in ring]
+    ys = [xy[1] for xy in ring]
+    col0 = int(math.floor(min(xs) / size))
+    col1 = int(math.ceil(max(xs) / size))
+    row0 = int(math.floor(-max(ys) / size))
+    row1 = int(math.ceil(-min(ys) / size))
 
-        if (descriptions is not None) and (len(descriptions) != count):
-            print('The number of descriptions is not equal to the number of images.')
-            return
+    return {
+        'crs': info['crs'],
+        'crs_transform': [size, 0, 0, 0, -size, 0],
+        'pixel_size': size,
+        'col0': col0,
+        'row0': row0,
+        'width': max(col1 - col0, 1),
+        'height': max(row1 - row0, 1),
+        'bands': info['bands'],
+        'types': info['types'],
+    }
 
-        if descriptions is None:
-            descriptions = ee_object.aggregate_array('system:index').getInfo()
 
-        images = ee_object.toList(count)
+def _grid_windows(width, height, tile_width, tile_height):
+    """Splits a width x height pixel grid into (col_off, row_off, width, height) windows."""
+    for row_off in range(0, height, tile_height):
+        for col_off in range(0, width, tile_width):
+            yield (col_off, row_off, min(tile_width, width - col_off), min(tile_height, height - row_off))
 
-        for i in range(0, count):
-            image = ee.Image(images.get(i))
-            name = descriptions[i]
-            ee_export_image_to_drive(
-                image, name, folder, region, scale, crs, max_pixels, file_format, format_options)
 
-    except Exception as e:
-        print(e)
+def _grid_window_geometry(grid, window, inset=0.25):
+    """Returns the ee.Geometry of a pixel window of a grid created by _ee_pixel_grid(), shrunk by a fraction of a pixel so that only the pixels of the window are covered."""
+    col_off, row_off, width, height = window
+    size = grid['pixel_size']
+    col = grid['col0'] + col_off
+    row = grid['row0'] + row_off
+    coords = [
+        (col + inset) * size,
+        -(row + height - inset) * size,
+        (col + width - inset) * size,
+        -(row + inset) * size,
+    ]
+    return ee.Geometry.Rectangle(coords, grid['crs'], False)
 
 
-def ee_to_numpy(ee_object, bands=None, region=None, properties=None, default_value=None):
+def ee_to_numpy(ee_object, bands=None, region=None, properties=None, default_value=None, tiled=False, scale=None, crs='EPSG:4326', max_pixels=262144, max_workers=4, out_file=None):
     """Extracts a rectangular region of pixels from an image into a 2D numpy array per band.
 
     Args:
         ee_object (object): The image to sample.
         bands (list, optional): The list of band names to extract. Please make sure that all bands have the same spatial resolution. Defaults to None. 
-        region (object, optional): The region whose projected bounding box is used to sample the image. The maximum number of pixels you can export is 262,144. Resampling and reprojecting all bands to a fixed scale can be useful. Defaults to the footprint in each band.
+        region (object, optional): The region whose projected bounding box is used to sample the image. The maximum number of pixels you can export is 262,144 unless tiled is True. Resampling and reprojecting all bands to a fixed scale can be useful. Defaults to the footprint in each band.
         properties (list, optional): The properties to copy over from the sampled image. Defaults to all non-system properties.
         default_value (float, optional): A default value used when a sampled pixel is masked or outside a band's footprint. Defaults to None.
+        tiled (bool, optional): Whether to split the region into tiles of at most max_pixels pixels, fetch them concurrently, and assemble them into a single array. Defaults to False.
+        scale (float, optional): The pixel size in meters used in tiled mode. Defaults to the nominal scale of the image's first band.
+        crs (str, optional): The CRS of the output array in tiled mode. Defaults to 'EPSG:4326'.
+        max_pixels (int, optional): The maximum number of pixels per tile in tiled mode. Defaults to 262144.
+        max_workers (int, optional): The maximum number of tiles fetched at the same time in tiled mode. Defaults to 4.
+        out_file (str, optional): File path to a .npy file. If given in tiled mode, the output is a numpy memmap backed by this file. Defaults to None.
 
     Returns:
         array: A 3D numpy array.
@@ -1217,25 +2500,79 @@ def ee_to_numpy(ee_object, bands=None, region=None, properties=None, default_val
 
         if bands is not None:
             ee_object = ee_object.select(bands)
-        else:
-            bands = ee_object.bandNames().getInfo()
+
+        if tiled:
+            return _ee_to_numpy_tiled(ee_object, region, default_value, scale, crs, max_pixels, max_workers, out_file)
 
         band_arrs = ee_object.sampleRectangle(
             region=region, properties=properties, defaultValue=default_value)
-        band_values = []
 
-        for band in bands:
-            band_arr = band_arrs.get(band).getInfo()
-            band_value = np.array(band_arr)
-            band_values.append(band_value)
-
-        image = np.dstack(band_values)
+        # all bands and their types come back in a single request
+        info = batch_get_info({
+            'bands': ee_object.bandNames(),
+            'types': ee_object.bandTypes(),
+            'values': band_arrs.toDictionary(ee_object.bandNames()),
+        }, saved=0)
+
+        bands = info['bands']
+        dtype = _ee_band_types_to_dtype(info['types'], bands, default_value)
+        first = info['values'][bands[0]]
+        image = np.empty((len(first), len(first[0]), len(bands)), dtype=dtype)
+        for index, band in enumerate(bands):
+            image[:, :, index] = info['values'][band]
         return image
 
     except Exception as e:
         print(e)
 
 
+def _ee_to_numpy_tiled(ee_object, region, default_value=None, scale=None, crs='EPSG:4326', max_pixels=262144, max_workers=4, out_file=None):
+    """Fetches an image as a grid of sampleRectangle tiles and assembles them into one numpy array. See ee_to_numpy() for the arguments."""
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+
+    grid = _ee_pixel_grid(ee_object, region, scale, crs)
+    bands = grid['bands']
+    image = ee_object.reproject(crs=grid['crs'], crsTransform=grid['crs_transform'])
+
+    dtype = _ee_band_types_to_dtype(grid['types'], bands, default_value)
+
+    shape = (grid['height'], grid['width'], len(bands))
+    if out_file is not None:
+        out_file = os.path.abspath(out_file)
+        if not os.path.exists(os.path.dirname(out_file)):
+            os.makedirs(os.path.dirname(out_file))
+        out_array = np.lib.format.open_memmap(out_file, mode='w+', dtype=dtype, shape=shape)
+    else:
+        out_array = np.zeros(shape, dtype=dtype)
+
+    tile_size = max(int(math.sqrt(max_pixels)), 1)
+    windows = list(_grid_windows(grid['width'], grid['height'], tile_size, tile_size))
+    print('Fetching {} x {} pixels in {} tiles ...'.format(grid['width'], grid['height'], len(windows)))
+
+    def fetch(window):
+        geometry = _grid_window_geometry(grid, window)
+        # one request per tile for all bands
+        tile = image.sampleRectangle(region=geometry, properties=[], defaultValue=default_value)
+        values = tile.toDictionary(bands).getInfo()
+
+        col_off, row_off, width, height = window
+        for index, band in enumerate(bands):
+            band_value = np.asarray(values[band], dtype=dtype)
+            if band_value.shape != (height, width):
+                raise ValueError('The tile at row {}, column {} of band {} has shape {} instead of {}.'.format(
+                    row_off, col_off, band, band_value.shape, (height, width)))
+            out_array[row_off:row_off + height, col_off:col_off + width, index] = band_value
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        # list() re-raises the first exception of any tile
+        list(executor.map(fetch, windows))
+
+    if out_file is not None:
+        out_array.flush()
+    return out_array
+
+
 def download_ee_video(collection, video_args, out_gif):
     """Downloads a video thumbnail as a GIF image from Earth Engine.
 
@@ -1273,16 +2610,12 @@ def download_ee_video(collection, video_args, out_gif):
         url = collection.getVideoThumbURL(video_args)
 
         print('Downloading GIF image from {}\nPlease wait ...'.format(url))
-        r = requests.get(url, stream=True)
-
-        if r.status_code != 200:
+        try:
+            stream_download(url, out_gif)
+        except requests.HTTPError:
             print('An error occurred while downloading.')
             return
-        else:
-            with open(out_gif, 'wb') as fd:
-                for chunk in r.iter_content(chunk_size=1024):
-                    fd.write(chunk)
-            print('The GIF image has been saved to: {}'.format(out_gif))
+        print('The GIF image has been saved to: {}'.format(out_gif))
     except Exception as e:
         print(e)
 
@@ -2351,19 +3684,68 @@ def load_GeoTIFFs(URLs):
     return ee.ImageCollection(collection)
 
 
-def get_COG_tile(url, titiler_endpoint="https://titiler.xyz/", **kwargs):
-    """Get a tile layer from a Cloud Optimized GeoTIFF (COG).
-        Source code adapted from https://developmentseed.org/titiler/examples/Working_with_CloudOptimizedGeoTIFF_simple/
+_titiler_session = None
+_titiler_session_lock = threading.Lock()
+
+# Responses of titiler /info, /bounds and /tilejson.json requests, keyed by (url, params).
+titiler_cache = _LRUCache(maxsize=1024, ttl=3600)
+
+
+def get_titiler_session():
+    """Returns the requests.Session shared by all titiler requests, so that connections are kept alive and reused.
+
+    Returns:
+        requests.Session: The shared session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _titiler_session
+    with _titiler_session_lock:
+        if _titiler_session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _titiler_session = session
+    return _titiler_session
+
+
+def _titiler_get(url, params=None, cache=True):
+    """Sends a GET request to titiler through the shared session and returns the JSON response.
+
+    Args:
+        url (str): The titiler URL, e.g., https://titiler.xyz/cog/bounds
+        params (dict, optional): The query parameters. Defaults to None.
+        cache (bool, optional): Whether to reuse a cached response for the same URL and parameters. Defaults to True.
+
+    Returns:
+        dict: The JSON response. Cached responses are returned as copies, so callers may modify them.
+    """
+    params = params or {}
+    key = (url, tuple(sorted((k, str(v)) for k, v in params.items())))
+    if cache:
+        r = titiler_cache.get(key)
+        if r is not None:
+            return copy.deepcopy(r)
+
+    response = get_titiler_session().get(url, params=params)
+    r = response.json()
+    if cache and response.status_code == 200:
+        titiler_cache.set(key, copy.deepcopy(r))
+    return r
+
+
+def get_COG_tilejson(url, titiler_endpoint="https://titiler.xyz/", **kwargs):
+    """Get the TileJSON of a Cloud Optimized GeoTIFF (COG).
 
     Args:
         url (str): HTTP URL to a COG, e.g., https://opendata.digitalglobe.com/events/mauritius-oil-spill/post-event/2020-08-12/105001001F1B5B00/105001001F1B5B00.tif
         titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
 
     Returns:
-        tuple: Returns the COG Tile layer URL and bounds. 
+        dict: The TileJSON, including the tile URL and bounds.
     """
-    import requests
-
     params = {"url": url}
 
     TileMatrixSetId='WebMercatorQuad'
@@ -2378,17 +3760,31 @@ def get_COG_tile(url, titiler_endpoint="https://titiler.xyz/", **kwargs):
     if "maxzoom" in kwargs.keys():
         params["maxzoom"] = kwargs["maxzoom"]
 
-    r = requests.get(
+    return _titiler_get(
         f"{titiler_endpoint}/cog/{TileMatrixSetId}/tilejson.json",
         params = params
-    ).json()
+    )
+
+
+def get_COG_tile(url, titiler_endpoint="https://titiler.xyz/", **kwargs):
+    """Get a tile layer from a Cloud Optimized GeoTIFF (COG).
+        Source code adapted from https://developmentseed.org/titiler/examples/Working_with_CloudOptimizedGeoTIFF_simple/
+
+    Args:
+        url (str): HTTP URL to a COG, e.g., https://opendata.digitalglobe.com/events/mauritius-oil-spill/post-event/2020-08-12/105001001F1B5B00/105001001F1B5B00.tif
+        titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
+
+    Returns:
+        tuple: Returns the COG Tile layer URL and bounds. 
+    """
+    r = get_COG_tilejson(url, titiler_endpoint, **kwargs)
 
     return r["tiles"][0]
 
 
 def get_COG_mosaic(links, titiler_endpoint="https://titiler.xyz/", username='anonymous', layername=None, overwrite=False, verbose=True, **kwargs):
 
-    import requests
+    session = get_titiler_session()
 
     if layername is None:
         layername = 'layer_' + random_string(5)
@@ -2398,7 +3794,7 @@ def get_COG_mosaic(links, titiler_endpoint="https://titiler.xyz/", username='ano
             print("Creating COG masaic ...")
 
         # Create token
-        r = requests.post(
+        r = session.post(
             f"{titiler_endpoint}/tokens/create",
             json={
                 "username": username,
@@ -2408,7 +3804,7 @@ def get_COG_mosaic(links, titiler_endpoint="https://titiler.xyz/", username='ano
         token = r["token"]
 
         # Create mosaic
-        r = requests.post(
+        r = session.post(
             f"{titiler_endpoint}/mosaicjson/create",
             json={
                 "username": username,
@@ -2422,9 +3818,10 @@ def get_COG_mosaic(links, titiler_endpoint="https://titiler.xyz/", username='ano
             }
         ).json()
 
-        r = requests.get(
+        r = _titiler_get(
             f"{titiler_endpoint}/mosaicjson/{username}.{layername}/tilejson.json",
-        ).json()
+            cache=False
+        )
 
         return r["tiles"][0]
 
@@ -2432,29 +3829,60 @@ def get_COG_mosaic(links, titiler_endpoint="https://titiler.xyz/", username='ano
         print(e)
 
 
-def get_COG_bounds(url, titiler_endpoint="https://titiler.xyz/"):
+def get_COG_bounds(url, titiler_endpoint="https://titiler.xyz/", local=True):
     """Get the bounding box of a Cloud Optimized GeoTIFF (COG).
 
     Args:
         url (str): HTTP URL to a COG, e.g., https://opendata.digitalglobe.com/events/mauritius-oil-spill/post-event/2020-08-12/105001001F1B5B00/105001001F1B5B00.tif
         titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
+        local (bool, optional): Whether to read the bounds from the COG header first and only ask titiler if that fails. Defaults to True.
 
     Returns:
         list: A list of values representing [left, bottom, right, top]
     """    
-    import requests
+    if local:
+        try:
+            return read_COG_header(url)['bounds']
+        except Exception:
+            pass
 
-    r = requests.get(
+    r = _titiler_get(
         f"{titiler_endpoint}/cog/bounds",
         params = {
             "url": url
         }
-    ).json()   
+    )
 
     bounds = r["bounds"] 
     return bounds
 
 
+def get_COG_bounds_list(links, titiler_endpoint="https://titiler.xyz/", max_workers=16, max_retries=2, backoff=1.0):
+    """Get the bounding boxes of a list of Cloud Optimized GeoTIFFs (COGs) concurrently.
+
+    Args:
+        links (list): A list of HTTP URLs to COGs.
+        titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
+        max_workers (int, optional): The maximum number of requests running at the same time. Defaults to 16.
+        max_retries (int, optional): The number of times a failed request is retried. Defaults to 2.
+        backoff (float, optional): The number of seconds to wait before the first retry. The wait doubles after each failed attempt. Defaults to 1.0.
+
+    Returns:
+        list: A list of [left, bottom, right, top] bounds in the order of links, with None for COGs whose bounds could not be retrieved.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(link):
+        try:
+            return _retry(lambda attempt: get_COG_bounds(link, titiler_endpoint), max_retries, backoff)
+        except Exception as e:
+            print('Failed to get the bounds of {}: {}'.format(link, e))
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        return list(executor.map(fetch, links))
+
+
 def get_COG_center(url, titiler_endpoint="https://titiler.xyz/"):
     """Get the centroid of a Cloud Optimized GeoTIFF (COG).
 
@@ -2470,41 +3898,252 @@ def get_COG_center(url, titiler_endpoint="https://titiler.xyz/"):
     return center
 
 
-def get_COG_bands(url, titiler_endpoint="https://titiler.xyz/"):
+def get_COG_bands(url, titiler_endpoint="https://titiler.xyz/", local=True):
     """Get band names of a Cloud Optimized GeoTIFF (COG).
 
     Args:
         url (str): HTTP URL to a COG, e.g., https://opendata.digitalglobe.com/events/mauritius-oil-spill/post-event/2020-08-12/105001001F1B5B00/105001001F1B5B00.tif
         titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
+        local (bool, optional): Whether to read the band descriptions from the COG header first and only ask titiler if that fails. Defaults to True.
 
     Returns:
         list: A list of band names
     """    
-    import requests
+    if local:
+        try:
+            return read_COG_header(url)['descriptions']
+        except Exception:
+            pass
 
-    r = requests.get(
+    r = _titiler_get(
         f"{titiler_endpoint}/cog/info",
         params = {
             "url": url,
         }
-    ).json()
+    )
 
     bands = [b[1] for b in r['band_descriptions']]
     return bands
  
 
-def get_STAC_tile(url, bands=None, titiler_endpoint="https://titiler.xyz/", **kwargs):
-    """Get a tile layer from a single SpatialTemporal Asset Catalog (STAC) item.
+# Parsed COG headers, keyed by URL or file path.
+cog_header_cache = _LRUCache(maxsize=1024, ttl=3600)
+
+
+def _read_byte_range(url, offset, length, max_size=None):
+    """Reads a range of bytes from a local file or, with an HTTP range request, from a URL."""
+    if url.startswith('file://'):
+        url = url[len('file://'):]
+    if not url.startswith(('http://', 'https://')):
+        with open(url, 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+
+    headers = {'Range': 'bytes={}-{}'.format(offset, offset + length - 1)}
+    r = get_titiler_session().get(url, headers=headers, stream=True)
+    try:
+        if r.status_code == 206:
+            return r.content
+        elif r.status_code == 200 and offset == 0:
+            # the server ignores range requests, read only the beginning of the file
+            return r.raw.read(length)
+        raise ValueError('Range request failed with HTTP {}'.format(r.status_code))
+    finally:
+        r.close()
+
+
+def read_COG_header(url, header_size=65536):
+    """Reads the bounds, band count, data type, and overviews of a Cloud Optimized GeoTIFF (COG) from its TIFF header, using HTTP range requests for remote files.
+
+    Args:
+        url (str): HTTP URL or file path to a COG.
+        header_size (int, optional): The number of bytes to read at a time. Defaults to 65536.
+
+    Raises:
+        ValueError: If the file is not a GeoTIFF that can be parsed.
+
+    Returns:
+        dict: A dictionary containing bounds ([left, bottom, right, top] in EPSG:4326), native_bounds, epsg, width, height, band_count, dtype, overviews (decimation factors), and descriptions.
+    """
+    import struct
+    import xml.etree.ElementTree as ET
+
+    info = cog_header_cache.get(url)
+    if info is not None:
+        return copy.deepcopy(info)
+
+    blocks = {0: _read_byte_range(url, 0, header_size)}
+
+    def read(offset, length):
+        data = blocks[0]
+        if offset + length <= len(data):
+            return data[offset:offset + length]
+        if offset not in blocks or len(blocks[offset]) < length:
+            blocks[offset] = _read_byte_range(url, offset, max(length, header_size))
+        return blocks[offset][:length]
+
+    byte_order = read(0, 2)
+    if byte_order == b'II':
+        endian = '<'
+    elif byte_order == b'MM':
+        endian = '>'
+    else:
+        raise ValueError('{} is not a TIFF file.'.format(url))
+
+    version = struct.unpack(endian + 'H', read(2, 2))[0]
+    if version == 42:
+        big_tiff = False
+        ifd_offset = struct.unpack(endian + 'I', read(4, 4))[0]
+    elif version == 43:
+        big_tiff = True
+        ifd_offset = struct.unpack(endian + 'Q', read(8, 8))[0]
+    else:
+        raise ValueError('{} is not a TIFF file.'.format(url))
+
+    # TIFF type -> (struct format, size)
+    tiff_types = {1: ('B', 1), 2: ('c', 1), 3: ('H', 2), 4: ('I', 4), 5: ('II', 8), 6: ('b', 1), 7: ('B', 1), 8: ('h', 2),
+                  9: ('i', 4), 10: ('ii', 8), 11: ('f', 4), 12: ('d', 8), 16: ('Q', 8), 17: ('q', 8), 18: ('Q', 8)}
+
+    def read_ifd(offset):
+        if big_tiff:
+            count = struct.unpack(endian + 'Q', read(offset, 8))[0]
+            entry_size, value_size, entries_offset = 20, 8, offset + 8
+        else:
+            count = struct.unpack(endian + 'H', read(offset, 2))[0]
+            entry_size, value_size, entries_offset = 12, 4, offset + 2
+        entries = read(entries_offset, count * entry_size)
+
+        tags = {}
+        for i in range(count):
+            entry = entries[i * entry_size:(i + 1) * entry_size]
+            if big_tiff:
+                tag, dtype, n = struct.unpack(endian + 'HHQ', entry[:12])
+                raw = entry[12:]
+            else:
+                tag, dtype, n = struct.unpack(endian + 'HHI', entry[:8])
+                raw = entry[8:]
+            if dtype not in tiff_types:
+                continue
+            fmt, size = tiff_types[dtype]
+            if n * size > value_size:
+                value_offset = struct.unpack(endian + ('Q' if big_tiff else 'I'), raw)[0]
+                # skip large arrays such as tile offsets, they are not needed
+                if tag in (273, 279, 324, 325):
+                    continue
+                raw = read(value_offset, n * size)
+            values = struct.unpack(endian + fmt[0] * n * len(fmt), raw[:n * size])
+            if dtype == 2:
+                values = b''.join(values).decode('utf-8', 'ignore').rstrip('\x00')
+            elif dtype in (5, 10):
+                values = tuple(values[j] / values[j + 1] for j in range(0, len(values), 2))
+            tags[tag] = values
+
+        next_offset = read(entries_offset + count * entry_size, value_size)
+        next_offset = struct.unpack(endian + ('Q' if big_tiff else 'I'), next_offset)[0]
+        return tags, next_offset
+
+    tags, next_offset = read_ifd(ifd_offset)
+
+    width = tags[256][0]
+    height = tags[257][0]
+    band_count = tags.get(277, (1,))[0]
+    bits = tags.get(258, (1,))[0]
+    sample_format = tags.get(339, (1,))[0]
+    dtype = {1: 'uint', 2: 'int', 3: 'float'}.get(sample_format, 'uint') + str(bits)
+
+    # overviews are the following reduced-resolution IFDs that are not masks
+    overviews = []
+    while next_offset:
+        sub_tags, next_offset = read_ifd(next_offset)
+        subfile_type = sub_tags.get(254, (0,))[0]
+        if subfile_type & 1 and not subfile_type & 4:
+            overviews.append(int(round(width / sub_tags[256][0])))
+
+    # geo-referencing
+    geo_keys = {}
+    if 34735 in tags:
+        key_dir = tags[34735]
+        for i in range(key_dir[3]):
+            key_id, location, _, value = key_dir[4 + i * 4:8 + i * 4]
+            if location == 0:
+                geo_keys[key_id] = value
+
+    if 34264 in tags:
+        m = tags[34264]
+        a, b, c, d, e, f = m[0], m[1], m[3], m[4], m[5], m[7]
+    elif 33550 in tags and 33922 in tags:
+        sx, sy = tags[33550][:2]
+        i, j, _, x, y, _ = tags[33922][:6]
+        a, b, c, d, e, f = sx, 0.0, x - i * sx, 0.0, -sy, y + j * sy
+    else:
+        raise ValueError('{} is not geo-referenced.'.format(url))
+    if geo_keys.get(1025) == 2:
+        # RasterPixelIsPoint: the tie point is the center of the pixel
+        c -= (a + b) / 2
+        f -= (d + e) / 2
+
+    xs = [c, a * width + c, b * height + c, a * width + b * height + c]
+    ys = [f, d * width + f, e * height + f, d * width + e * height + f]
+    native_bounds = [min(xs), min(ys), max(xs), max(ys)]
+
+    if geo_keys.get(1024) == 2 or (1024 not in geo_keys and 3072 not in geo_keys):
+        epsg = geo_keys.get(2048, 4326)
+    else:
+        epsg = geo_keys.get(3072)
+
+    if epsg == 4326:
+        bounds = native_bounds
+    elif epsg in (3857, 900913):
+        radius = 6378137.0
+        left, bottom, right, top = native_bounds
+        bounds = [math.degrees(left / radius), math.degrees(2 * math.atan(math.exp(bottom / radius)) - math.pi / 2),
+                  math.degrees(right / radius), math.degrees(2 * math.atan(math.exp(top / radius)) - math.pi / 2)]
+    else:
+        try:
+            from pyproj import Transformer
+        except ImportError:
+            raise ValueError('pyproj is required to convert bounds from EPSG:{}.'.format(epsg))
+        transformer = Transformer.from_crs(
+            'EPSG:{}'.format(epsg), 'EPSG:4326', always_xy=True)
+        bounds = list(transformer.transform_bounds(*native_bounds, densify_pts=21))
+
+    descriptions = [''] * band_count
+    if 42112 in tags:
+        try:
+            for item in ET.fromstring(tags[42112]).iter('Item'):
+                if item.get('role') == 'description' and item.get('sample') is not None:
+                    index = int(item.get('sample'))
+                    if index < band_count:
+                        descriptions[index] = item.text or ''
+        except ET.ParseError:
+            pass
+
+    info = {
+        'bounds': bounds,
+        'native_bounds': native_bounds,
+        'epsg': epsg,
+        'width': width,
+        'height': height,
+        'band_count': band_count,
+        'dtype': dtype,
+        'overviews': overviews,
+        'descriptions': descriptions,
+    }
+    cog_header_cache.set(url, copy.deepcopy(info))
+    return info
+
+
+def get_STAC_tilejson(url, bands=None, titiler_endpoint="https://titiler.xyz/", **kwargs):
+    """Get the TileJSON of a single SpatialTemporal Asset Catalog (STAC) item.
 
     Args:
         url (str): HTTP URL to a STAC item, e.g., https://canada-spot-ortho.s3.amazonaws.com/canada_spot_orthoimages/canada_spot5_orthoimages/S5_2007/S5_11055_6057_20070622/S5_11055_6057_20070622.json
+        bands (list, optional): A list of up to 3 asset names to display. Defaults to the first asset.
         titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
 
     Returns:
-        tuple: Returns the COG Tile layer URL and bounds. 
+        dict: The TileJSON, including the tile URL and bounds.
     """
-    import requests
-
     params = {"url": url}
 
     TileMatrixSetId='WebMercatorQuad'
@@ -2534,10 +4173,23 @@ def get_STAC_tile(url, bands=None, titiler_endpoint="https://titiler.xyz/", **kw
     assets = ','.join(bands)
     params["assets"] = assets
 
-    r = requests.get(
+    return _titiler_get(
         f"{titiler_endpoint}/stac/{TileMatrixSetId}/tilejson.json",
         params = params
-    ).json()
+    )
+
+
+def get_STAC_tile(url, bands=None, titiler_endpoint="https://titiler.xyz/", **kwargs):
+    """Get a tile layer from a single SpatialTemporal Asset Catalog (STAC) item.
+
+    Args:
+        url (str): HTTP URL to a STAC item, e.g., https://canada-spot-ortho.s3.amazonaws.com/canada_spot_orthoimages/canada_spot5_orthoimages/S5_2007/S5_11055_6057_20070622/S5_11055_6057_20070622.json
+        titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
+
+    Returns:
+        tuple: Returns the COG Tile layer URL and bounds. 
+    """
+    r = get_STAC_tilejson(url, bands, titiler_endpoint, **kwargs)
 
     return r["tiles"][0]
 
@@ -2552,14 +4204,12 @@ def get_STAC_bounds(url, titiler_endpoint="https://titiler.xyz/"):
     Returns:
         list: A list of values representing [left, bottom, right, top]
     """    
-    import requests
-
-    r = requests.get(
+    r = _titiler_get(
         f"{titiler_endpoint}/stac/bounds",
         params = {
             "url": url
         }
-    ).json()   
+    )
 
     bounds = r["bounds"] 
     return bounds
@@ -2590,14 +4240,12 @@ def get_STAC_bands(url, titiler_endpoint="https://titiler.xyz/"):
     Returns:
         list: A list of band names
     """    
-    import requests
-
-    r = requests.get(
+    r = _titiler_get(
         f"{titiler_endpoint}/stac/info",
         params = {
             "url": url,
         }
-    ).json()
+    )
 
     return r
 
@@ -2657,18 +4305,88 @@ def explode(coords):
                 yield f
 
 
-def get_bounds(geometry, north_up=True, transform=None):
+# Nesting depth of the coordinate arrays of each GeoJSON geometry type.
+_GEOMETRY_DEPTHS = {
+    'Point': 0,
+    'MultiPoint': 1,
+    'LineString': 1,
+    'MultiLineString': 2,
+    'Polygon': 2,
+    'MultiPolygon': 3,
+}
+
+
+def _coordinate_points(geometry):
+    """Flattens the coordinates of a GeoJSON geometry into a list of points."""
+    coords = geometry['coordinates']
+    depth = _GEOMETRY_DEPTHS.get(geometry.get('type'))
+    if depth is None:
+        # unknown or missing type, fall back to walking the coordinates
+        return list(explode(coords))
+    elif depth == 0:
+        return [coords]
+    for _ in range(depth - 1):
+        coords = list(itertools.chain.from_iterable(coords))
+    return coords
+
+
+def _points_to_array(points):
+    """Converts a list of points to a contiguous (n, 2) numpy array of x, y values."""
+    import numpy as np
+
+    xy = np.fromiter(itertools.chain.from_iterable(points), dtype=float)
+    if xy.size != 2 * len(points):
+        # some points have a z value
+        xy = np.fromiter(itertools.chain.from_iterable(point[:2] for point in points), dtype=float)
+    return xy.reshape(-1, 2)
+
+
+def _iter_coordinate_points(geometry, use_bbox=True):
+    """Yields the flattened coordinates of a GeoJSON geometry, GeometryCollection, Feature, or FeatureCollection as lists of points.
+    The points are the original coordinate lists, not copies. If use_bbox, the corners of a geometry's bbox are yielded instead of its coordinates."""
+    if geometry is None:
+        return
+    if use_bbox and 'bbox' in geometry:
+        bbox = geometry['bbox']
+        yield [bbox[:2], bbox[2:4]]
+        return
+
+    geometry = geometry.get('geometry') or geometry
+    if 'features' in geometry:
+        for feature in geometry['features']:
+            for points in _iter_coordinate_points(feature.get('geometry'), use_bbox):
+                yield points
+    elif 'geometries' in geometry:
+        for item in geometry['geometries']:
+            for points in _iter_coordinate_points(item, use_bbox):
+                yield points
+    elif 'coordinates' in geometry:
+        yield _coordinate_points(geometry)
+
+
+def get_bounds(geometry, north_up=True, transform=None, per_feature=False):
     """Bounding box of a GeoJSON geometry, GeometryCollection, or FeatureCollection.
     left, bottom, right, top
     *not* xmin, ymin, xmax, ymax
     If not north_up, y will be switched to guarantee the above.
     Source code adapted from https://github.com/mapbox/rasterio/blob/master/rasterio/features.py#L361
+
+    Args:
+        geometry (dict): A GeoJSON dict.
+        north_up (bool, optional): Whether y increases upwards. Defaults to True.
+        transform (Affine, optional): An affine transform applied to the coordinates of a single geometry. Defaults to None.
+        per_feature (bool, optional): Whether to return the bounds of each feature of a FeatureCollection as an (n, 4) numpy array instead. Features without coordinates get NaN bounds. Defaults to False.
+
+    Returns:
+        tuple: (left, bottom, right, top)
     """
+    if per_feature and 'features' in geometry:
+        return get_feature_bounds(geometry, north_up)
 
     if 'bbox' in geometry:
         return tuple(geometry['bbox'])
 
-    geometry = geometry.get('geometry') or geometry  
+    geometry = geometry.get('geometry') or geometry
 
     # geometry must be a geometry, GeometryCollection, or FeatureCollection
     if not ('coordinates' in geometry or 'geometries' in geometry or 'features' in geometry):
@@ -2677,59 +4395,58 @@ def get_bounds(geometry, north_up=True, transform=None):
             "or FeatureCollection"
         )
 
-    if 'features' in geometry:
-        # Input is a FeatureCollection
-        xmins = []
-        ymins = []
-        xmaxs = []
-        ymaxs = []
-        for feature in geometry['features']:
-            xmin, ymin, xmax, ymax = get_bounds(feature['geometry'])
-            xmins.append(xmin)
-            ymins.append(ymin)
-            xmaxs.append(xmax)
-            ymaxs.append(ymax)
-        if north_up:
-            return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
-        else:
-            return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
+    if 'coordinates' in geometry and transform is not None:
+        # Input is a singular geometry object with a pixel transform
+        xy = _points_to_array(_coordinate_points(geometry))
+        x = transform.a * xy[:, 0] + transform.b * xy[:, 1] + transform.c
+        y = transform.d * xy[:, 0] + transform.e * xy[:, 1] + transform.f
+        return float(x.min()), float(y.max()), float(x.max()), float(y.min())
+
+    points = list(itertools.chain.from_iterable(_iter_coordinate_points(geometry)))
+    if not points:
+        raise ValueError("geometry does not contain any coordinates")
+    xy = _points_to_array(points)
+    xmin, ymin = xy.min(axis=0).tolist()
+    xmax, ymax = xy.max(axis=0).tolist()
+    if north_up:
+        return xmin, ymin, xmax, ymax
+    else:
+        return xmin, ymax, xmax, ymin
 
-    elif 'geometries' in geometry:
-        # Input is a geometry collection
-        xmins = []
-        ymins = []
-        xmaxs = []
-        ymaxs = []
-        for geometry in geometry['geometries']:
-            xmin, ymin, xmax, ymax = get_bounds(geometry)
-            xmins.append(xmin)
-            ymins.append(ymin)
-            xmaxs.append(xmax)
-            ymaxs.append(ymax)
-        if north_up:
-            return min(xmins), min(ymins), max(xmaxs), max(ymaxs)
-        else:
-            return min(xmins), max(ymaxs), max(xmaxs), min(ymins)
 
-    elif 'coordinates' in geometry:
-        # Input is a singular geometry object
-        if transform is not None:
-            xyz = list(explode(geometry['coordinates']))
-            xyz_px = [transform * point for point in xyz]
-            xyz = tuple(zip(*xyz_px))
-            return min(xyz[0]), max(xyz[1]), max(xyz[0]), min(xyz[1])
-        else:
-            xyz = tuple(zip(*list(explode(geometry['coordinates']))))
-            if north_up:
-                return min(xyz[0]), min(xyz[1]), max(xyz[0]), max(xyz[1])
-            else:
-                return min(xyz[0]), max(xyz[1]), max(xyz[0]), min(xyz[1])
+def get_feature_bounds(in_fc, north_up=True):
+    """Bounding boxes of every feature of a GeoJSON FeatureCollection.
 
-    # all valid inputs returned above, so whatever falls through is an error
-    raise ValueError(
-            "geometry must be a GeoJSON-like geometry, GeometryCollection, "
-            "or FeatureCollection"
-        )
+    Args:
+        in_fc (dict): A GeoJSON FeatureCollection dict.
+        north_up (bool, optional): If not north_up, y will be switched as in get_bounds(). Defaults to True.
+
+    Returns:
+        numpy.ndarray: An (n, 4) array of [left, bottom, right, top], NaN for features without coordinates.
+    """
+    import numpy as np
+
+    features = in_fc['features']
+    bounds = np.full((len(features), 4), np.nan)
+    points = []
+    counts = np.zeros(len(features), dtype=np.int64)
+    for index, feature in enumerate(features):
+        for feature_points in _iter_coordinate_points(feature.get('geometry')):
+            points.extend(feature_points)
+            counts[index] += len(feature_points)
+    if not points:
+        return bounds
+
+    xy = _points_to_array(points)
+    non_empty = counts > 0
+    starts = (np.cumsum(counts) - counts)[non_empty]
+    mins = np.minimum.reduceat(xy, starts, axis=0)
+    maxs = np.maximum.reduceat(xy, starts, axis=0)
+    if north_up:
+        bounds[non_empty] = np.column_stack([mins[:, 0], mins[:, 1], maxs[:, 0], maxs[:, 1]])
+    else:
+        bounds[non_empty] = np.column_stack([mins[:, 0], maxs[:, 1], maxs[:, 0], mins[:, 1]])
+    return bounds
 
         
 def get_center(geometry, north_up=True, transform=None):
@@ -2788,13 +4505,15 @@ def image_props(img, date_format='YYYY-MM-dd'):
     return props
 
 
-def image_stats(img, region=None, scale=None):
-    """Gets image descriptive statistics.
+def image_stats(img, region=None, scale=None, percentiles=None, histogram=None):
+    """Gets image descriptive statistics. All statistics are computed by a single combined reducer, so the pixels are scanned once.
 
     Args:
         img (ee.Image): The input image to calculate descriptive statistics.
         region (object, optional): The region over which to reduce data. Defaults to the footprint of the image's first band.
         scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
+        percentiles (list, optional): A list of percentiles (0-100) to compute, e.g., [10, 50, 90]. They are returned as p10, p50, p90. Defaults to None.
+        histogram (dict, optional): Histogram settings. Use max_buckets, min_bucket_width, and max_raw for ee.Reducer.histogram(), or hist_min, hist_max, and hist_steps for ee.Reducer.fixedHistogram(). Use {} for the default histogram. Defaults to None, which skips the histogram.
 
     Returns:
         ee.Dictionary: A dictionary containing the description statistics of the input image.
@@ -2804,96 +4523,82 @@ def image_stats(img, region=None, scale=None):
         print('The input object must be an ee.Image')
         return
 
-    stat_types = ['min', 'max', 'mean', 'std', 'sum']
+    if region is None:
+        region = img.geometry()
+
+    if scale is None:
+        scale = image_scale(img)
+
+    # statistic name -> reducer output name
+    stat_outputs = {'min': 'min', 'max': 'max',
+                    'mean': 'mean', 'std': 'stdDev', 'sum': 'sum'}
+
+    reducer = ee.Reducer.min().combine(ee.Reducer.max(), sharedInputs=True) \
+        .combine(ee.Reducer.mean(), sharedInputs=True) \
+        .combine(ee.Reducer.stdDev(), sharedInputs=True) \
+        .combine(ee.Reducer.sum(), sharedInputs=True)
+
+    if percentiles is not None:
+        reducer = reducer.combine(
+            ee.Reducer.percentile(percentiles), sharedInputs=True)
+        for percentile in percentiles:
+            name = 'p{}'.format(percentile)
+            stat_outputs[name] = name
+
+    if histogram is not None:
+        if 'hist_min' in histogram.keys():
+            hist_reducer = ee.Reducer.fixedHistogram(
+                histogram['hist_min'], histogram['hist_max'], histogram['hist_steps'])
+        else:
+            hist_reducer = ee.Reducer.histogram(maxBuckets=histogram.get('max_buckets'), minBucketWidth=histogram.get(
+                'min_bucket_width'), maxRaw=histogram.get('max_raw'))
+        reducer = reducer.combine(hist_reducer, sharedInputs=True)
+        stat_outputs['histogram'] = 'histogram'
 
-    image_min = image_min_value(img, region, scale)
-    image_max = image_max_value(img, region, scale)
-    image_mean = image_mean_value(img, region, scale)
-    image_std = image_std_value(img, region, scale)
-    image_sum = image_sum_value(img, region, scale)
+    result = img.reduceRegion(**{
+        'reducer': reducer,
+        'geometry': region,
+        'scale': scale,
+        'maxPixels': 1e12
+    })
 
-    stat_results = ee.List(
-        [image_min, image_max, image_mean, image_std, image_sum])
+    # results are keyed as band_output, regroup them into {stat: {band: value}}
+    bands = img.bandNames()
+    stat_types = list(stat_outputs.keys())
+    stat_results = [ee.Dictionary.fromLists(bands, bands.map(lambda b: result.get(ee.String(b).cat('_' + output))))
+                    for output in stat_outputs.values()]
 
     stats = ee.Dictionary.fromLists(stat_types, stat_results)
 
     return stats
 
 
-def adjust_longitude(in_fc):
+def adjust_longitude(in_fc, inplace=True):
     """Adjusts longitude if it is less than -180 or greater than 180.
 
     Args:
-        in_fc (dict): The input dictionary containing coordinates.
+        in_fc (dict): The input GeoJSON dictionary (a geometry, GeometryCollection, Feature, or FeatureCollection).
+        inplace (bool, optional): Whether to modify the input dictionary rather than a copy of it. Defaults to True.
 
     Returns:
         dict: A dictionary containing the converted longitudes
     """
-    try:
-
-        keys = in_fc.keys()
+    import numpy as np
 
-        if 'geometry' in keys:
+    try:
+        if not inplace:
+            in_fc = copy.deepcopy(in_fc)
 
-            coordinates = in_fc['geometry']['coordinates']
+        points = list(itertools.chain.from_iterable(
+            _iter_coordinate_points(in_fc, use_bbox=False)))
+        if not points:
+            return in_fc
 
-            if in_fc['geometry']['type'] == 'Point':
-                longitude = coordinates[0]
-                if longitude < - 180:
-                    longitude = 360 + longitude
-                elif longitude > 180:
-                    longitude = longitude - 360
-                in_fc['geometry']['coordinates'][0] = longitude
-
-            elif in_fc['geometry']['type'] == 'Polygon':
-                for index1, item in enumerate(coordinates):
-                    for index2, element in enumerate(item):
-                        longitude = element[0]
-                        if longitude < - 180:
-                            longitude = 360 + longitude
-                        elif longitude > 180:
-                            longitude = longitude - 360
-                        in_fc['geometry']['coordinates'][index1][index2][0] = longitude
-
-            elif in_fc['geometry']['type'] == 'LineString':
-                for index, element in enumerate(coordinates):
-                    longitude = element[0]
-                    if longitude < - 180:
-                        longitude = 360 + longitude
-                    elif longitude > 180:
-                        longitude = longitude - 360
-                    in_fc['geometry']['coordinates'][index][0] = longitude
-
-        elif 'type' in keys:
-
-            coordinates = in_fc['coordinates']
-
-            if in_fc['type'] == 'Point':
-                longitude = coordinates[0]
-                if longitude < - 180:
-                    longitude = 360 + longitude
-                elif longitude > 180:
-                    longitude = longitude - 360
-                in_fc['coordinates'][0] = longitude
-
-            elif in_fc['type'] == 'Polygon':
-                for index1, item in enumerate(coordinates):
-                    for index2, element in enumerate(item):
-                        longitude = element[0]
-                        if longitude < - 180:
-                            longitude = 360 + longitude
-                        elif longitude > 180:
-                            longitude = longitude - 360
-                        in_fc['coordinates'][index1][index2][0] = longitude
-
-            elif in_fc['type'] == 'LineString':
-                for index, element in enumerate(coordinates):
-                    longitude = element[0]
-                    if longitude < - 180:
-                        longitude = 360 + longitude
-                    elif longitude > 180:
-                        longitude = longitude - 360
-                    in_fc['coordinates'][index][0] = longitude
+        longitudes = np.fromiter((point[0] for point in points), dtype=float, count=len(points))
+        outside = np.flatnonzero((longitudes < -180) | (longitudes > 180))
+        adjusted = (longitudes[outside] + 180) % 360 - 180
+        for index, longitude in zip(outside.tolist(), adjusted.tolist()):
+            points[index][0] = longitude
 
         return in_fc
 
@@ -2902,17 +4607,24 @@ def adjust_longitude(in_fc):
         return None
 
 
-def zonal_statistics(in_value_raster, in_zone_vector, out_file_path, statistics_type='MEAN', scale=None, crs=None, tile_scale=1.0, **kwargs):
+def zonal_statistics(in_value_raster, in_zone_vector, out_file_path, statistics_type='MEAN', scale=None, crs=None, tile_scale=1.0, batch_size=None, grid_size=None, max_workers=4, max_retries=2, **kwargs):
     """Summarizes the values of a raster within the zones of another dataset and exports the results as a csv, shp, json, kml, or kmz.
 
     Args:
         in_value_raster (object): An ee.Image that contains the values on which to calculate a statistic.
         in_zone_vector (object): An ee.FeatureCollection that defines the zones.
-        out_file_path (str): Output file path that will contain the summary of the values in each zone. The file type can be: csv, shp, json, kml, kmz
-        statistics_type (str, optional): Statistic type to be calculated. Defaults to 'MEAN'. For 'HIST', you can provide three parameters: max_buckets, min_bucket_width, and max_raw. For 'FIXED_HIST', you must provide three parameters: hist_min, hist_max, and hist_steps.
+        out_file_path (str): Output file path that will contain the summary of the values in each zone. The file type can be: csv, shp, json, kml, kmz, parquet, feather
+        statistics_type (str | list, optional): Statistic type to be calculated, or a list of them to compute in a single pass. Defaults to 'MEAN'. For 'HIST', you can provide three parameters: max_buckets, min_bucket_width, and max_raw. For 'FIXED_HIST', you must provide three parameters: hist_min, hist_max, and hist_steps. With several statistic types, the output columns are named after them, e.g., MEAN, STD, MIN_MAX_min, and MIN_MAX_max (prefixed by the band name for multi-band images).
         scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
         crs (str, optional): The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale. Defaults to None.
         tile_scale (float, optional): A scaling factor used to reduce aggregation tile size; using a larger tileScale (e.g. 2 or 4) may enable computations that run out of memory with the default. Defaults to 1.0.
+        batch_size (int, optional): If given, the zones are split into batches of about this many features (by ranges of a random column) that are reduced and downloaded concurrently, and the output file type must be csv, parquet, or feather. Defaults to None.
+        grid_size (float, optional): If given, the zones are split into batches by the cell of a grid of this size (in degrees) that contains their first vertex. Takes precedence over batch_size. Defaults to None.
+        max_workers (int, optional): The maximum number of batches processed at the same time. Defaults to 4.
+        max_retries (int, optional): The number of times a failed batch is retried, doubling tile_scale each time. Defaults to 2.
+
+    Returns:
+        dict: In partitioned mode, a dictionary mapping each batch that failed to its error.
     """
 
     if not isinstance(in_value_raster, ee.Image):
@@ -2923,7 +4635,11 @@ def zonal_statistics(in_value_raster, in_zone_vector, out_file_path, statistics_
         print('The input zone data must be an ee.FeatureCollection.')
         return
 
-    allowed_formats = ['csv', 'json', 'kml', 'kmz', 'shp']
+    partitioned = bool(batch_size or grid_size)
+    if partitioned:
+        allowed_formats = ['csv', 'parquet', 'feather']
+    else:
+        allowed_formats = ['csv', 'json', 'kml', 'kmz', 'shp', 'parquet', 'feather']
     filename = os.path.abspath(out_file_path)
     basename = os.path.basename(filename)
     # name = os.path.splitext(basename)[0]
@@ -2948,15 +4664,20 @@ def zonal_statistics(in_value_raster, in_zone_vector, out_file_path, statistics_
     if 'max_buckets' in kwargs.keys():
         max_buckets = kwargs['max_buckets']
     if 'min_bucket_width' in kwargs.keys():
-        min_bucket_width = kwargs['min_bucket']
+        min_bucket_width = kwargs['min_bucket_width']
     if 'max_raw' in kwargs.keys():
         max_raw = kwargs['max_raw']
 
-    if statistics_type.upper() == 'FIXED_HIST' and ('hist_min' in kwargs.keys()) and ('hist_max' in kwargs.keys()) and ('hist_steps' in kwargs.keys()):
+    if isinstance(statistics_type, str):
+        statistics_types = [statistics_type.upper()]
+    else:
+        statistics_types = list(dict.fromkeys(stat.upper() for stat in statistics_type))
+
+    if 'FIXED_HIST' in statistics_types and ('hist_min' in kwargs.keys()) and ('hist_max' in kwargs.keys()) and ('hist_steps' in kwargs.keys()):
         hist_min = kwargs['hist_min']
         hist_max = kwargs['hist_max']
         hist_steps = kwargs['hist_steps']
-    elif statistics_type.upper() == 'FIXED_HIST':
+    elif 'FIXED_HIST' in statistics_types:
         print('To use fixedHistogram, please provide these three parameters: hist_min, hist_max, and hist_steps.')
         return
 
@@ -2973,52 +4694,211 @@ def zonal_statistics(in_value_raster, in_zone_vector, out_file_path, statistics_
         'FIXED_HIST': ee.Reducer.fixedHistogram(hist_min, hist_max, hist_steps)
     }
 
-    if not (statistics_type.upper() in allowed_statistics.keys()):
+    # The output names of each reducer, used to prefix them when combining reducers
+    statistics_outputs = {
+        'MIN_MAX': ['min', 'max'],
+    }
+
+    if not statistics_types or any(stat not in allowed_statistics.keys() for stat in statistics_types):
         print('The statistics type must be one of the following: {}'.format(
             ', '.join(list(allowed_statistics.keys()))))
         return
 
+    if len(statistics_types) == 1:
+        reducer = allowed_statistics[statistics_types[0]]
+    else:
+        reducer = None
+        for stat in statistics_types:
+            if stat in statistics_outputs:
+                outputs = ['{}_{}'.format(stat, output) for output in statistics_outputs[stat]]
+            else:
+                outputs = [stat]
+            stat_reducer = allowed_statistics[stat].setOutputs(outputs)
+            if reducer is None:
+                reducer = stat_reducer
+            else:
+                reducer = reducer.combine(stat_reducer, sharedInputs=True)
+
     if scale is None:
         scale = in_value_raster.projection().nominalScale().multiply(10)
 
+    if partitioned:
+        return _zonal_statistics_partitioned(in_value_raster, in_zone_vector, filename, reducer, scale, crs,
+                                             tile_scale, batch_size, grid_size, max_workers, max_retries)
+
     try:
         print('Computing statistics ...')
         result = in_value_raster.reduceRegions(
-            collection=in_zone_vector, reducer=allowed_statistics[statistics_type], scale=scale, crs=crs, tileScale=tile_scale)
+            collection=in_zone_vector, reducer=reducer, scale=scale, crs=crs, tileScale=tile_scale)
         ee_export_vector(result, filename)
     except Exception as e:
         print(e)
 
 
-def zonal_statistics_by_group(in_value_raster, in_zone_vector, out_file_path, statistics_type='SUM', decimal_places=0, denominator=1.0, scale=None, crs=None, tile_scale=1.0):
+def _concat_csv_files(in_files, out_file, exclude=[]):
+    """Concatenates csv files into one, using the union of their columns."""
+    fieldnames = []
+    for in_file in in_files:
+        with open(in_file, newline='') as f:
+            header = next(csv.reader(f), [])
+        fieldnames.extend(name for name in header if name not in fieldnames and name not in exclude)
+
+    with open(out_file, 'w', newline='') as out:
+        writer = csv.DictWriter(out, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        for in_file in in_files:
+            with open(in_file, newline='') as f:
+                writer.writerows(csv.DictReader(f))
+
+
+def _zonal_statistics_partitioned(in_value_raster, in_zone_vector, filename, reducer, scale=None, crs=None, tile_scale=1.0, batch_size=None, grid_size=None, max_workers=4, max_retries=2):
+    """Runs reduceRegions on batches of zones concurrently and concatenates the results into one csv, parquet, or feather file. See zonal_statistics() for the arguments."""
+    import tempfile
+    import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    cell_property = 'eefolium_cell'
+    random_property = 'eefolium_random'
+
+    try:
+        if grid_size:
+            # Each zone belongs to the grid cell containing its first vertex, so it intersects that cell.
+            # Batches select the zones of a cell with an indexed filterBounds before assigning cells.
+            def set_cell(feature):
+                part = ee.Geometry(feature.geometry().geometries().get(0))
+                xy = ee.List(part.coordinates()).flatten()
+                x = ee.Number(xy.get(0)).divide(grid_size).floor().int()
+                y = ee.Number(xy.get(1)).divide(grid_size).floor().int()
+                return feature.set(cell_property, x.format().cat('_').cat(y.format()))
+
+            names = sorted(in_zone_vector.map(set_cell).aggregate_array(cell_property).distinct().getInfo(),
+                           key=lambda name: [int(i) for i in name.split('_')])
+            batches = []
+            for name in names:
+                x, y = [int(i) * grid_size for i in name.split('_')]
+                cell = ee.Geometry.Rectangle([x, y, x + grid_size, y + grid_size], 'EPSG:4326', False)
+                batches.append(in_zone_vector.filterBounds(cell).map(set_cell).filter(
+                    ee.Filter.eq(cell_property, name)))
+        else:
+            # Split by value ranges of a random column, since toList(count, offset) materializes every
+            # feature before the offset.
+            count = in_zone_vector.size().getInfo()
+            n_batches = int(math.ceil(count / float(batch_size)))
+            zones = in_zone_vector.randomColumn(random_property, 0)
+            names = [str(i) for i in range(n_batches)]
+            batches = []
+            for i in range(n_batches):
+                batch_filter = ee.Filter.gte(random_property, i / float(n_batches))
+                if i < n_batches - 1:
+                    batch_filter = ee.Filter.And(batch_filter, ee.Filter.lt(random_property, (i + 1) / float(n_batches)))
+                batches.append(zones.filter(batch_filter))
+    except Exception as e:
+        print(e)
+        return
+
+    if not batches:
+        print('The input zone data is empty.')
+        return
+
+    print('Computing statistics for {} batches ...'.format(len(batches)))
+    out_dir = os.path.dirname(filename)
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    tmp_dir = tempfile.mkdtemp(prefix='zonal_', dir=out_dir)
+
+    def run(i):
+        start = time.time()
+        scale_factors = []
+
+        def compute(attempt):
+            # a larger tileScale lowers the memory used per tile after a failure
+            scale_factors.append(tile_scale * 2 ** attempt)
+            result = in_value_raster.reduceRegions(
+                collection=batches[i], reducer=reducer, scale=scale, crs=crs, tileScale=scale_factors[-1])
+            # remove .geo coordinate field
+            result = result.select(['.*'], None, False)
+            url = result.getDownloadURL(filetype='csv', filename='batch_{}'.format(i))
+            out_csv = os.path.join(tmp_dir, 'batch_{}.csv'.format(i))
+            stream_download(url, out_csv)
+            return out_csv
+
+        try:
+            out_csv = _retry(compute, max_retries)
+        except Exception as e:
+            return None, scale_factors[-1], time.time() - start, e
+        return out_csv, scale_factors[-1], time.time() - start, None
+
+    errors = {}
+    out_files = [None] * len(batches)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(run, i): i for i in range(len(batches))}
+        for done, future in enumerate(as_completed(futures)):
+            i = futures[future]
+            out_csv, scale_factor, seconds, error = future.result()
+            if error is None:
+                out_files[i] = out_csv
+                print('Batch {} ({}/{}) finished in {:.1f} s (tileScale={})'.format(
+                    names[i], done + 1, len(batches), seconds, scale_factor))
+            else:
+                errors[names[i]] = error
+                print('Batch {} ({}/{}) failed after {:.1f} s (tileScale={})\n{}'.format(
+                    names[i], done + 1, len(batches), seconds, scale_factor, error))
+
+    out_files = [out_file for out_file in out_files if out_file is not None]
+    if not out_files:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        print('None of the batches could be computed.')
+        return errors
+
+    try:
+        if filename.lower().endswith(('.parquet', '.feather')):
+            out_csv = os.path.join(tmp_dir, 'zonal_statistics.csv')
+            _concat_csv_files(out_files, out_csv, exclude=[cell_property, random_property])
+            vector_to_columnar(out_csv, filename)
+        else:
+            _concat_csv_files(out_files, filename, exclude=[cell_property, random_property])
+        print('Data downloaded to {}'.format(filename))
+    except Exception as e:
+        print(e)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return errors
+
+
+def zonal_statistics_by_group(in_value_raster, in_zone_vector, out_file_path, statistics_type='SUM', decimal_places=0, denominator=1.0, scale=None, crs=None, tile_scale=1.0, class_values=None):
     """Summarizes the area or percentage of a raster by group within the zones of another dataset and exports the results as a csv, shp, json, kml, or kmz.
 
     Args:
         in_value_raster (object): An integer Image that contains the values on which to calculate area/percentage.
         in_zone_vector (object): An ee.FeatureCollection that defines the zones.
-        out_file_path (str): Output file path that will contain the summary of the values in each zone. The file type can be: csv, shp, json, kml, kmz
+        out_file_path (str): Output file path that will contain the summary of the values in each zone. The file type can be: csv, shp, json, kml, kmz, parquet, feather
         statistics_type (str, optional): Can be either 'SUM' or 'PERCENTAGE' . Defaults to 'SUM'.
         decimal_places (int, optional): The number of decimal places to use. Defaults to 0.
         denominator (float, optional): To covert area units (e.g., from square meters to square kilometers). Defaults to 1.0.
         scale (float, optional): A nominal scale in meters of the projection to work in. Defaults to None.
         crs (str, optional): The projection to work in. If unspecified, the projection of the image's first band is used. If specified in addition to scale, rescaled to the specified scale. Defaults to None.
         tile_scale (float, optional): A scaling factor used to reduce aggregation tile size; using a larger tileScale (e.g. 2 or 4) may enable computations that run out of memory with the default. Defaults to 1.0.
+        class_values (list, optional): The class values of the raster, which become the Class_<value> columns. Defaults to None, which uses the classes found in the zones.
 
     """
     if not isinstance(in_value_raster, ee.Image):
         print('The input raster must be an ee.Image.')
         return
 
-    band_count = in_value_raster.bandNames().size().getInfo()
+    info = batch_get_info({
+        'bands': in_value_raster.bandNames(),
+        'types': in_value_raster.bandTypes(),
+    })
 
     band_name = ''
-    if band_count == 1:
-        band_name = in_value_raster.bandNames().get(0)
+    if len(info['bands']) == 1:
+        band_name = info['bands'][0]
     else:
         print('The input image can only have one band.')
         return
 
-    band_types = in_value_raster.bandTypes().get(band_name).getInfo()
+    band_types = info['types'][band_name]
     band_type = band_types.get('precision')
     if band_type != 'int':
         print('The input image band must be integer type.')
@@ -3028,7 +4908,7 @@ def zonal_statistics_by_group(in_value_raster, in_zone_vector, out_file_path, st
         print('The input zone data must be an ee.FeatureCollection.')
         return
 
-    allowed_formats = ['csv', 'json', 'kml', 'kmz', 'shp']
+    allowed_formats = ['csv', 'json', 'kml', 'kmz', 'shp', 'parquet', 'feather']
     filename = os.path.abspath(out_file_path)
     basename = os.path.basename(filename)
     # name = os.path.splitext(basename)[0]
@@ -3055,15 +4935,6 @@ def zonal_statistics_by_group(in_value_raster, in_zone_vector, out_file_path, st
     try:
 
         print('Computing ... ')
-        geometry = in_zone_vector.geometry()
-
-        hist = in_value_raster.reduceRegion(ee.Reducer.frequencyHistogram(
-        ), geometry=geometry, bestEffort=True, scale=scale)
-        class_values = ee.Dictionary(hist.get(band_name)).keys().map(
-            lambda v: ee.Number.parse(v)).sort()
-
-        class_names = class_values.map(
-            lambda c: ee.String('Class_').cat(ee.Number(c).format()))
 
         # class_count = class_values.size().getInfo()
         dataset = ee.Image.pixelArea().divide(denominator).addBands(in_value_raster)
@@ -3077,6 +4948,15 @@ def zonal_statistics_by_group(in_value_raster, in_zone_vector, out_file_path, st
             'scale': scale
         })
 
+        if class_values is None:
+            # the classes present in the zones, taken from the grouped sums
+            class_values = init_result.aggregate_array('groups').flatten().map(
+                lambda x: ee.Dictionary(x).get('group')).distinct().sort()
+            class_names = class_values.map(
+                lambda c: ee.String('Class_').cat(ee.Number(c).format()))
+        else:
+            class_names = ee.List(['Class_{}'.format(int(c)) for c in sorted(class_values)])
+
         # def build_dict(input_list):
 
         #     decimal_format = '%.{}f'.format(decimal_places)
@@ -195,6 +195,12 @@ class Map(folium.Map):
         if "plugin_LayerControl" not in kwargs.keys():
             kwargs["plugin_LayerControl"] = False
 
+        # Pass map_id_cache=None to always request new map IDs from Earth Engine
+        self.map_id_cache = kwargs.pop("map_id_cache", map_id_cache)
+        # With lazy_layers=True, EE tile URLs are requested when the map is rendered
+        self.lazy_layers = kwargs.pop("lazy_layers", False)
+        self._pending_layers = []
+
         super().__init__(**kwargs)
 
         if kwargs.get("add_google_map"):
@@ -246,17 +252,15 @@ class Map(folium.Map):
                 )
             )
 
-    def add_layer(
-        self, ee_object, vis_params={}, name="Layer untitled", shown=True, opacity=1.0
-    ):
-        """Adds a given EE object to the map as a layer.
+    def _ee_object_to_image(self, ee_object, vis_params={}):
+        """Converts a given EE object to an ee.Image that can be visualized, styling vector data as needed.
 
         Args:
             ee_object (Collection|Feature|Image|MapId): The object to add to the map.
             vis_params (dict, optional): The visualization parameters. Defaults to {}.
-            name (str, optional): The name of the layer. Defaults to 'Layer untitled'.
-            shown (bool, optional): A flag indicating whether the layer should be on by default. Defaults to True.
-            opacity (float, optional): The layer's opacity represented as a number between 0 and 1. Defaults to 1.
+
+        Returns:
+            ee.Image: The image to request the map ID from.
         """
         image = None
 
@@ -300,19 +304,164 @@ class Map(folium.Map):
         elif isinstance(ee_object, ee.imagecollection.ImageCollection):
             image = ee_object.mosaic()
 
-        map_id_dict = ee.Image(image).getMapId(vis_params)
-        folium.raster_layers.TileLayer(
-            tiles=map_id_dict["tile_fetcher"].url_format,
+        return image
+
+    def _add_ee_tile_layer(self, url_format, name, shown, opacity):
+        """Adds a tile layer served by Earth Engine to the map.
+
+        Returns:
+            object: The folium TileLayer added to the map.
+        """
+        layer = folium.raster_layers.TileLayer(
+            tiles=url_format,
             attr="Google Earth Engine",
             name=name,
             overlay=True,
             control=True,
             show=shown,
             opacity=opacity,
-        ).add_to(self)
+        )
+        layer.add_to(self)
+        return layer
+
+    def _resolve_map_ids(self, requests, max_workers=8):
+        """Requests map IDs concurrently.
+
+        Args:
+            requests (list): A list of (image, vis_params) tuples.
+            max_workers (int, optional): The maximum number of map ID requests running at the same time. Defaults to 8.
+
+        Returns:
+            list: The map ID dictionary, or the raised exception, of each request in input order.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def resolve(request):
+            try:
+                return get_map_id(request[0], request[1], self.map_id_cache)
+            except Exception as e:
+                return e
+
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(executor.map(resolve, requests))
+
+    def add_layer(
+        self, ee_object, vis_params={}, name="Layer untitled", shown=True, opacity=1.0
+    ):
+        """Adds a given EE object to the map as a layer. If the map was created with lazy_layers=True, the tile URL is only requested when the map is rendered.
+
+        Args:
+            ee_object (Collection|Feature|Image|MapId): The object to add to the map.
+            vis_params (dict, optional): The visualization parameters. Defaults to {}.
+            name (str, optional): The name of the layer. Defaults to 'Layer untitled'.
+            shown (bool, optional): A flag indicating whether the layer should be on by default. Defaults to True.
+            opacity (float, optional): The layer's opacity represented as a number between 0 and 1. Defaults to 1.
+        """
+        image = self._ee_object_to_image(ee_object, vis_params)
+        if self.lazy_layers:
+            layer = self._add_ee_tile_layer("", name, shown, opacity)
+            self._pending_layers.append((layer, image, vis_params))
+            return
+
+        map_id_dict = get_map_id(image, vis_params, self.map_id_cache)
+        self._add_ee_tile_layer(map_id_dict["url_format"], name, shown, opacity)
 
     addLayer = add_layer
 
+    def add_layers(self, specs, max_workers=8):
+        """Adds multiple EE objects to the map, requesting their map IDs concurrently. The layers are added in the order of specs.
+
+        Args:
+            specs (list): A list of layers to add. Each item is either a dictionary of add_layer() arguments (e.g., {'ee_object': image, 'vis_params': {}, 'name': 'DEM'}) or a tuple of positional add_layer() arguments.
+            max_workers (int, optional): The maximum number of map ID requests running at the same time. Defaults to 8.
+
+        Returns:
+            dict: A dictionary mapping the index of each failed spec to its exception. Empty if all layers were added.
+        """
+        layers = []
+        errors = {}
+        for index, spec in enumerate(specs):
+            if isinstance(spec, dict):
+                args = dict(spec)
+            else:
+                args = dict(
+                    zip(["ee_object", "vis_params", "name", "shown", "opacity"], spec)
+                )
+            args.setdefault("vis_params", {})
+            args.setdefault("name", "Layer untitled")
+            args.setdefault("shown", True)
+            args.setdefault("opacity", 1.0)
+            try:
+                args["image"] = self._ee_object_to_image(
+                    args["ee_object"], args["vis_params"]
+                )
+            except Exception as e:
+                errors[index] = e
+            layers.append(args)
+
+        pending = [index for index in range(len(layers)) if index not in errors]
+        if self.lazy_layers:
+            results = [None] * len(pending)
+        else:
+            results = self._resolve_map_ids(
+                [(layers[i]["image"], layers[i]["vis_params"]) for i in pending],
+                max_workers,
+            )
+        map_ids = dict(zip(pending, results))
+
+        for index, args in enumerate(layers):
+            if isinstance(map_ids.get(index), Exception):
+                errors[index] = map_ids[index]
+            if index in errors:
+                print("Failed to add layer {}: {}".format(args["name"], errors[index]))
+            elif self.lazy_layers:
+                layer = self._add_ee_tile_layer(
+                    "", args["name"], args["shown"], args["opacity"]
+                )
+                self._pending_layers.append((layer, args["image"], args["vis_params"]))
+            else:
+                self._add_ee_tile_layer(
+                    map_ids[index]["url_format"],
+                    args["name"],
+                    args["shown"],
+                    args["opacity"],
+                )
+
+        return errors
+
+    addLayers = add_layers
+
+    def resolve_layers(self, max_workers=8):
+        """Requests the tile URLs of all pending EE layers in one concurrent batch. Layers that have been removed from the map are skipped. This is called automatically when a map created with lazy_layers=True is rendered.
+
+        Args:
+            max_workers (int, optional): The maximum number of map ID requests running at the same time. Defaults to 8.
+        """
+        pending = [
+            item
+            for item in self._pending_layers
+            if item[0].get_name() in self._children
+        ]
+        self._pending_layers = []
+
+        results = self._resolve_map_ids(
+            [(image, vis_params) for _, image, vis_params in pending], max_workers
+        )
+        for (layer, _, _), map_id_dict in zip(pending, results):
+            if isinstance(map_id_dict, Exception):
+                print("Failed to add layer {}: {}".format(layer.layer_name, map_id_dict))
+                del self._children[layer.get_name()]
+            else:
+                layer.tiles = map_id_dict["url_format"]
+
+    def render(self, **kwargs):
+        """Resolves pending EE layers before rendering the map. Calling _repr_html_(), save(), or get_root().render() all go through this method."""
+        if self._pending_layers:
+            self.resolve_layers()
+        super().render(**kwargs)
+
     def set_center(self, lon, lat, zoom=10):
         """Centers the map view at a given coordinates with the given zoom level.
 
@@ -477,8 +626,14 @@ class Map(folium.Map):
             shown (bool, optional): A flag indicating whether the layer should be on by default. Defaults to True.
             titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
         """
-        tile_url = get_COG_tile(url, titiler_endpoint, **kwargs)
-        center= get_COG_center(url, titiler_endpoint)  # (lon, lat)
+        tilejson = get_COG_tilejson(url, titiler_endpoint, **kwargs)
+        tile_url = tilejson["tiles"][0]
+        if "bounds" in tilejson:
+            # the TileJSON already has the bounds, no need for another request
+            bounds = tilejson["bounds"]
+            center = ((bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2)
+        else:
+            center = get_COG_center(url, titiler_endpoint)  # (lon, lat)
         self.add_tile_layer(tiles=tile_url, name=name, attribution=attribution, opacity=opacity, shown=shown)
         self.set_center(lon=center[0], lat=center[1], zoom=10)
 
@@ -494,6 +649,7 @@ class Map(folium.Map):
         overwrite=False,
         show_footprints=False,
         verbose=True,
+        max_workers=16,
         **kwargs
     ):
         """Add a virtual mosaic of COGs to the map.
@@ -509,6 +665,7 @@ class Map(folium.Map):
             overwrite (bool, optional): Whether or not to replace existing layer with the same layer name. Defaults to False.
             show_footprints (bool, optional): Whether or not to show footprints of COGs. Defaults to False.
             verbose (bool, optional): Whether or not to print descriptions. Defaults to True.
+            max_workers (int, optional): The maximum number of footprint requests running at the same time. Defaults to 16.
         """
         layername = name.replace(" ", "_")  
         tile = get_COG_mosaic(links, titiler_endpoint=titiler_endpoint, username=username, layername=layername, overwrite=overwrite, verbose=verbose)
@@ -517,12 +674,10 @@ class Map(folium.Map):
         if show_footprints:
             if verbose:
                 print(f"Generating footprints of {len(links)} COGs. This might take a while ...")
-            coords = []
-            for link in links:
-                coord = get_COG_bounds(link)
-                if coord is not None:
-                    coords.append(coord)
-            fc = coords_to_geojson(coords)
+            coords = get_COG_bounds_list(
+                links, titiler_endpoint, max_workers=max_workers
+            )
+            fc = coords_to_geojson([coord for coord in coords if coord is not None])
 
             # style_function = lambda x: {'opacity': 1, 'dashArray': '1', 'fillOpacity': 0, 'weight': 1}
 
@@ -561,8 +716,13 @@ class Map(folium.Map):
             shown (bool, optional): A flag indicating whether the layer should be on by default. Defaults to True.
             titiler_endpoint (str, optional): Titiler endpoint. Defaults to "https://titiler.xyz/".
         """
-        tile_url = get_STAC_tile(url, bands, titiler_endpoint, **kwargs)
-        center= get_STAC_center(url, titiler_endpoint)
+        tilejson = get_STAC_tilejson(url, bands, titiler_endpoint, **kwargs)
+        tile_url = tilejson["tiles"][0]
+        if "bounds" in tilejson:
+            bounds = tilejson["bounds"]
+            center = ((bounds[0] + bounds[2]) / 2, (bounds[1] + bounds[3]) / 2)
+        else:
+            center = get_STAC_center(url, titiler_endpoint)
         self.add_tile_layer(tiles=tile_url, name=name, attribution=attribution, opacity=opacity, shown=shown)
         self.set_center(lon=center[0], lat=center[1], zoom=10)
         
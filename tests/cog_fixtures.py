@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+"""Builds the small handcrafted GeoTIFF headers in tests/data used by test_cog_header.py.
+
+Run `python tests/cog_fixtures.py` from the repository root to regenerate them.
+"""
+
+
+import os
+import struct
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+# TIFF type -> struct format
+TYPES = {2: 's', 3: 'H', 4: 'I', 12: 'd', 16: 'Q'}
+
+GDAL_METADATA = (b'<GDALMetadata>'
+                 b'<Item name="DESCRIPTION" sample="0" role="description">red</Item>'
+                 b'<Item name="DESCRIPTION" sample="2" role="description">blue</Item>'
+                 b'</GDALMetadata>\0')
+
+
+def build_tiff(ifds, bigtiff=False, byteorder='<'):
+    """Encodes a list of IFDs, each a list of (tag, type, values) entries, as a TIFF or BigTIFF file."""
+    offset_format, count_format, slot = ('Q', 'Q', 8) if bigtiff else ('I', 'H', 4)
+    entry_format = 'HHQ' if bigtiff else 'HHI'
+    entry_size = 20 if bigtiff else 12
+    mark = b'II' if byteorder == '<' else b'MM'
+    header_size = 16 if bigtiff else 8
+
+    encoded = []
+    for ifd in ifds:
+        entries = []
+        for tag, dtype, values in sorted(ifd):
+            if dtype == 2:
+                raw, count = values, len(values)
+            else:
+                raw = struct.pack(byteorder + TYPES[dtype] * len(values), *values)
+                count = len(values)
+            entries.append((tag, dtype, count, raw))
+        ifd_size = struct.calcsize(count_format) + len(entries) * entry_size + slot
+        overflow = sum(len(raw) + len(raw) % 2 for _, _, _, raw in entries if len(raw) > slot)
+        encoded.append((entries, ifd_size, overflow))
+
+    starts = []
+    position = header_size
+    for _, ifd_size, overflow in encoded:
+        starts.append(position)
+        position += ifd_size + overflow
+
+    if bigtiff:
+        data = mark + struct.pack(byteorder + 'HHHQ', 43, 8, 0, starts[0])
+    else:
+        data = mark + struct.pack(byteorder + 'HI', 42, starts[0])
+
+    for index, (entries, ifd_size, _) in enumerate(encoded):
+        extra = b''
+        ifd = struct.pack(byteorder + count_format, len(entries))
+        for tag, dtype, count, raw in entries:
+            ifd += struct.pack(byteorder + entry_format, tag, dtype, count)
+            if len(raw) > slot:
+                ifd += struct.pack(byteorder + offset_format, starts[index] + ifd_size + len(extra))
+                extra += raw + b'\0' * (len(raw) % 2)
+            else:
+                ifd += raw.ljust(slot, b'\0')
+        next_ifd = starts[index + 1] if index + 1 < len(starts) else 0
+        data += ifd + struct.pack(byteorder + offset_format, next_ifd) + extra
+    return data
+
+
+def geokeys(model_type, epsg, raster_type=1):
+    """Encodes a GeoKeyDirectory with the model type, raster type, and EPSG code."""
+    epsg_key = 3072 if model_type == 1 else 2048
+    return (1, 1, 0, 3, 1024, 0, 1, model_type, 1025, 0, 1, raster_type, epsg_key, 0, 1, epsg)
+
+
+def overview(subfile_type, width, height):
+    return [(254, 4, (subfile_type,)), (256, 3, (width,)), (257, 3, (height,))]
+
+
+FIXTURES = {
+    # 3-band uint16, EPSG:4326, one overview and one mask, band descriptions
+    'cog_4326.tif': dict(ifds=[
+        [(256, 3, (100,)), (257, 3, (50,)), (258, 3, (16, 16, 16)), (277, 3, (3,)), (339, 3, (1, 1, 1)),
+         (33550, 12, (0.01, 0.01, 0.0)), (33922, 12, (0.0, 0.0, 0.0, 10.0, 20.0, 0.0)),
+         (34735, 3, geokeys(2, 4326)), (42112, 2, GDAL_METADATA)],
+        overview(1, 50, 25),
+        overview(5, 100, 50),
+    ]),
+    # BigTIFF float32, EPSG:3857, ModelTransformation, PixelIsPoint, two overviews
+    'cog_3857_bigtiff.tif': dict(bigtiff=True, ifds=[
+        [(256, 3, (100,)), (257, 3, (50,)), (258, 3, (32,)), (277, 3, (1,)), (339, 3, (3,)),
+         (34264, 12, (1000.0, 0.0, 0.0, -1000000.0, 0.0, -1000.0, 0.0, 2000000.0,
+                      0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0)),
+         (34735, 3, geokeys(1, 3857, raster_type=2))],
+        overview(1, 50, 25),
+        overview(1, 25, 13),
+    ]),
+    # big-endian int16, EPSG:4326, no overviews or descriptions
+    'cog_4326_motorola.tif': dict(byteorder='>', ifds=[
+        [(256, 3, (360,)), (257, 3, (180,)), (258, 3, (16,)), (339, 3, (2,)),
+         (33550, 12, (1.0, 1.0, 0.0)), (33922, 12, (0.0, 0.0, 0.0, -180.0, 90.0, 0.0)),
+         (34735, 3, geokeys(2, 4326))],
+    ]),
+}
+
+
+def main():
+    if not os.path.exists(DATA_DIR):
+        os.makedirs(DATA_DIR)
+    for name, kwargs in FIXTURES.items():
+        with open(os.path.join(DATA_DIR, name), 'wb') as f:
+            f.write(build_tiff(**kwargs))
+
+
+if __name__ == '__main__':
+    main()
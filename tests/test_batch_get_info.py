@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""Tests for the batched getInfo calls in `eefolium.common`."""
+
+
+import unittest
+from unittest import mock
+
+from eefolium import common
+
+
+class StubComputed:
+    """A stand-in for ee.Dictionary and ee.List whose getInfo() returns its input."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def getInfo(self):
+        return self.values
+
+
+class TestBatchGetInfo(unittest.TestCase):
+    """Tests for `batch_get_info` and `get_info_stats`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        common.get_info_stats(reset=True)
+        patches = [mock.patch.object(common.ee, 'Dictionary', StubComputed),
+                   mock.patch.object(common.ee, 'List', StubComputed)]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_values(self):
+        """Test that dictionaries and lists keep their structure."""
+        self.assertEqual(common.batch_get_info({'a': 1, 'b': [2]}), {'a': 1, 'b': [2]})
+        self.assertEqual(common.batch_get_info((1, 2, 3)), [1, 2, 3])
+
+    def test_saved(self):
+        """Test that only values that would have needed their own getInfo call count as saved."""
+        common.batch_get_info({'a': 1, 'b': 2, 'c': 3})
+        common.batch_get_info({'a': 1, 'b': 2}, saved=0)
+        common.batch_get_info([1])
+        self.assertEqual(common.get_info_stats(reset=True), {'requests': 3, 'values': 6, 'saved': 2})
+        self.assertEqual(common.get_info_stats(), {'requests': 0, 'values': 0, 'saved': 0})
+
+
+if __name__ == '__main__':
+    unittest.main()
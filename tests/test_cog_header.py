@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+
+"""Tests for the COG header reader in `eefolium.common`."""
+
+
+import math
+import os
+import re
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from eefolium import common
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def mercator_to_lonlat(x, y):
+    radius = 6378137.0
+    return math.degrees(x / radius), math.degrees(2 * math.atan(math.exp(y / radius)) - math.pi / 2)
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves the files in tests/data, honoring Range headers unless the server disables them."""
+
+    def do_GET(self):
+        path = os.path.join(DATA_DIR, os.path.basename(self.path))
+        if not os.path.exists(path):
+            self.send_response(404)
+            self.end_headers()
+            return
+        with open(path, 'rb') as f:
+            data = f.read()
+        match = re.match(r'bytes=(\d+)-(\d+)', self.headers.get('Range', ''))
+        if match and self.server.ranges:
+            data = data[int(match.group(1)):int(match.group(2)) + 1]
+            self.send_response(206)
+        else:
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestReadCOGHeader(unittest.TestCase):
+    """Tests for `read_COG_header` on local files."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        common.cog_header_cache.clear()
+
+    def test_4326(self):
+        """Test a classic TIFF with an overview, a mask, and band descriptions."""
+        info = common.read_COG_header(os.path.join(DATA_DIR, 'cog_4326.tif'))
+        self.assertEqual(info['bounds'], [10.0, 19.5, 11.0, 20.0])
+        self.assertEqual(info['epsg'], 4326)
+        self.assertEqual((info['width'], info['height'], info['band_count']), (100, 50, 3))
+        self.assertEqual(info['dtype'], 'uint16')
+        self.assertEqual(info['overviews'], [2])
+        self.assertEqual(info['descriptions'], ['red', '', 'blue'])
+
+    def test_3857_bigtiff_pixel_is_point(self):
+        """Test a BigTIFF in web mercator with a ModelTransformation and PixelIsPoint raster type."""
+        info = common.read_COG_header(os.path.join(DATA_DIR, 'cog_3857_bigtiff.tif'))
+        self.assertEqual(info['epsg'], 3857)
+        self.assertEqual(info['native_bounds'], [-1000500.0, 1950500.0, -900500.0, 2000500.0])
+        left, bottom = mercator_to_lonlat(-1000500.0, 1950500.0)
+        right, top = mercator_to_lonlat(-900500.0, 2000500.0)
+        for value, expected in zip(info['bounds'], [left, bottom, right, top]):
+            self.assertAlmostEqual(value, expected, places=9)
+        self.assertEqual((info['band_count'], info['dtype']), (1, 'float32'))
+        self.assertEqual(info['overviews'], [2, 4])
+        self.assertEqual(info['descriptions'], [''])
+
+    def test_big_endian(self):
+        """Test a big-endian TIFF without overviews."""
+        info = common.read_COG_header('file://' + os.path.join(DATA_DIR, 'cog_4326_motorola.tif'))
+        self.assertEqual(info['bounds'], [-180.0, -90.0, 180.0, 90.0])
+        self.assertEqual(info['dtype'], 'int16')
+        self.assertEqual(info['overviews'], [])
+
+    def test_small_reads(self):
+        """Test that values beyond the first read are fetched separately."""
+        info = common.read_COG_header(os.path.join(DATA_DIR, 'cog_4326.tif'), header_size=16)
+        self.assertEqual(info['descriptions'], ['red', '', 'blue'])
+        self.assertEqual(info['overviews'], [2])
+
+    def test_not_a_tiff(self):
+        """Test that other files raise a ValueError."""
+        with self.assertRaises(ValueError):
+            common.read_COG_header(os.path.abspath(__file__))
+
+    def test_cached_copies(self):
+        """Test that modifying a returned header does not change the cached one."""
+        path = os.path.join(DATA_DIR, 'cog_4326.tif')
+        common.read_COG_header(path)['bounds'][0] = 100
+        self.assertEqual(common.get_COG_bounds(path), [10.0, 19.5, 11.0, 20.0])
+
+    def test_get_COG_bounds_without_titiler(self):
+        """Test that get_COG_bounds and get_COG_bands read local headers without calling titiler."""
+        path = os.path.join(DATA_DIR, 'cog_4326.tif')
+        with mock.patch.object(common, '_titiler_get', side_effect=AssertionError('titiler called')):
+            self.assertEqual(common.get_COG_bounds(path), [10.0, 19.5, 11.0, 20.0])
+            self.assertEqual(common.get_COG_bands(path), ['red', '', 'blue'])
+
+    def test_get_COG_bounds_fallback(self):
+        """Test that get_COG_bounds asks titiler when the header cannot be parsed."""
+        with mock.patch.object(common, '_titiler_get', return_value={'bounds': [1, 2, 3, 4]}) as titiler_get:
+            self.assertEqual(common.get_COG_bounds(os.path.abspath(__file__)), [1, 2, 3, 4])
+        titiler_get.assert_called_once()
+
+
+class TestReadCOGHeaderHTTP(unittest.TestCase):
+    """Tests for `read_COG_header` over HTTP."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        common.cog_header_cache.clear()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), RangeHandler)
+        self.server.ranges = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{}/'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_range_requests(self):
+        """Test reading a header with several range requests."""
+        info = common.read_COG_header(self.url + 'cog_3857_bigtiff.tif', header_size=32)
+        self.assertEqual(info['overviews'], [2, 4])
+
+    def test_ranges_ignored(self):
+        """Test a server that ignores range requests: the beginning of the file is enough if it contains the header."""
+        self.server.ranges = False
+        info = common.read_COG_header(self.url + 'cog_4326.tif')
+        self.assertEqual(info['bounds'], [10.0, 19.5, 11.0, 20.0])
+
+        common.cog_header_cache.clear()
+        with self.assertRaises(ValueError):
+            common.read_COG_header(self.url + 'cog_4326.tif', header_size=16)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+"""Tests for the GeoJSON/csv to Parquet and Feather conversion in `eefolium.common`."""
+
+
+import json
+import os
+import shutil
+import struct
+import tempfile
+import unittest
+
+from eefolium import common
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+FEATURES = [
+    {'type': 'Feature', 'properties': {'a': 1, 'b': 'x'},
+     'geometry': {'type': 'Point', 'coordinates': [1.0, 2.0]}},
+    {'type': 'Feature', 'properties': {'a': 2.5, 'c': True},
+     'geometry': {'type': 'Polygon', 'coordinates': [[[0, 0], [1, 0], [1, 1], [0, 0]]]}},
+    {'type': 'Feature', 'properties': None, 'geometry': None},
+]
+
+
+class TestIterGeojsonFeatures(unittest.TestCase):
+    """Tests for `_iter_geojson_features`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        shutil.rmtree(self.tmp_dir)
+
+    def write(self, data, **kwargs):
+        in_file = os.path.join(self.tmp_dir, 'in.geojson')
+        with open(in_file, 'w') as f:
+            json.dump(data, f, **kwargs)
+        return in_file
+
+    def test_small_chunks(self):
+        """Test that features spanning chunk boundaries are decoded."""
+        data = {'type': 'FeatureCollection', 'columns': {'features': 'String'}, 'features': FEATURES}
+        for kwargs in [{}, {'indent': 2}]:
+            in_file = self.write(data, **kwargs)
+            for chunk_size in [1, 7, 1024]:
+                features = list(common._iter_geojson_features(in_file, chunk_size=chunk_size))
+                self.assertEqual(features, FEATURES)
+
+    def test_empty(self):
+        """Test a collection without features."""
+        in_file = self.write({'type': 'FeatureCollection', 'features': []})
+        self.assertEqual(list(common._iter_geojson_features(in_file)), [])
+
+    def test_truncated(self):
+        """Test that a truncated file raises an error."""
+        in_file = self.write({'type': 'FeatureCollection', 'features': FEATURES})
+        with open(in_file) as f:
+            data = f.read()
+        with open(in_file, 'w') as f:
+            f.write(data[:len(data) // 2])
+        with self.assertRaises(ValueError):
+            list(common._iter_geojson_features(in_file, chunk_size=16))
+
+
+class TestGeojsonToWkb(unittest.TestCase):
+    """Tests for `_geojson_to_wkb`."""
+
+    def test_point(self):
+        """Test a point with a z value."""
+        wkb = common._geojson_to_wkb({'type': 'Point', 'coordinates': [1, 2, 3]})
+        self.assertEqual(wkb, struct.pack('<BI2d', 1, 1, 1, 2))
+
+    def test_multipolygon(self):
+        """Test the structure of a MultiPolygon."""
+        ring = [[0, 0], [1, 0], [1, 1], [0, 0]]
+        wkb = common._geojson_to_wkb({'type': 'MultiPolygon', 'coordinates': [[ring], [ring]]})
+        polygon = struct.pack('<BII', 1, 3, 1) + struct.pack('<I8d', 4, *[v for p in ring for v in p])
+        self.assertEqual(wkb, struct.pack('<BII', 1, 6, 2) + polygon + polygon)
+
+
+@unittest.skipUnless(HAS_PYARROW, 'pyarrow is not installed')
+class TestVectorToColumnar(unittest.TestCase):
+    """Tests for `vector_to_columnar`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        shutil.rmtree(self.tmp_dir)
+
+    def convert(self, features, out_name, **kwargs):
+        in_file = os.path.join(self.tmp_dir, 'in.geojson')
+        with open(in_file, 'w') as f:
+            json.dump({'type': 'FeatureCollection', 'features': features}, f)
+        out_file = os.path.join(self.tmp_dir, out_name)
+        common.vector_to_columnar(in_file, out_file, **kwargs)
+        return out_file
+
+    def test_mixed_properties(self):
+        """Test that properties missing from the first features become columns."""
+        import pyarrow.parquet as pq
+
+        for batch_size in [1, 2, 10000]:
+            out_file = self.convert(FEATURES, 'out.parquet', batch_size=batch_size)
+            table = pq.read_table(out_file)
+            self.assertEqual(table.column_names, ['a', 'b', 'c', 'geometry'])
+            self.assertEqual(table.column('a').to_pylist(), [1.0, 2.5, None])
+            self.assertEqual(table.column('b').to_pylist(), ['x', None, None])
+            self.assertEqual(table.column('c').to_pylist(), [None, True, None])
+            self.assertEqual(table.column('geometry').to_pylist()[0],
+                             struct.pack('<BI2d', 1, 1, 1.0, 2.0))
+            self.assertIsNone(table.column('geometry').to_pylist()[2])
+
+    def test_null_first_feature(self):
+        """Test a statistic column that is missing from the first feature, as in Earth Engine output for empty zones."""
+        import pyarrow.feather as feather
+
+        features = [
+            {'type': 'Feature', 'properties': {'name': 'a'}, 'geometry': None},
+            {'type': 'Feature', 'properties': {'name': 'b', 'mean': 1.5}, 'geometry': None},
+        ]
+        out_file = self.convert(features, 'out.feather', batch_size=1)
+        table = feather.read_table(out_file, memory_map=True)
+        self.assertEqual(table.column('mean').to_pylist(), [None, 1.5])
+
+    def test_geo_metadata(self):
+        """Test the GeoParquet metadata."""
+        import pyarrow.parquet as pq
+
+        out_file = self.convert(FEATURES, 'out.parquet')
+        geo = json.loads(pq.read_schema(out_file).metadata[b'geo'])
+        self.assertEqual(geo['primary_column'], 'geometry')
+        self.assertEqual(geo['columns']['geometry']['geometry_types'], ['Point', 'Polygon'])
+
+    def test_csv(self):
+        """Test that empty csv values become nulls."""
+        import pyarrow.parquet as pq
+
+        in_file = os.path.join(self.tmp_dir, 'in.csv')
+        with open(in_file, 'w') as f:
+            f.write('a,b\n1,\n2,x\n')
+        out_file = os.path.join(self.tmp_dir, 'out.parquet')
+        common.vector_to_columnar(in_file, out_file)
+        self.assertEqual(pq.read_table(out_file).to_pylist(),
+                         [{'a': 1, 'b': None}, {'a': 2, 'b': 'x'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
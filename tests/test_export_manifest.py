@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""Tests for the export manifest used to resume downloads in `eefolium.common`."""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from eefolium import common
+
+
+class TestExportManifest(unittest.TestCase):
+    """Tests for `_write_export_manifest` and `_is_export_complete`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.tmp_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.tmp_dir, 'image.tif'), 'wb') as f:
+            f.write(b'0123456789')
+        common._write_export_manifest(self.tmp_dir, 'image.tif', ['image.tif'])
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        shutil.rmtree(self.tmp_dir)
+
+    def record(self):
+        return common._read_export_manifest(self.tmp_dir).get('image.tif')
+
+    def test_complete(self):
+        """Test a file that is unchanged since it was recorded."""
+        self.assertTrue(common._is_export_complete(self.record(), self.tmp_dir))
+        self.assertTrue(common._is_export_complete(self.record(), self.tmp_dir, verify=True))
+        self.assertFalse(common._is_export_complete(None, self.tmp_dir))
+
+    def test_size_changed(self):
+        """Test that a file with a different size is downloaded again."""
+        with open(os.path.join(self.tmp_dir, 'image.tif'), 'ab') as f:
+            f.write(b'0')
+        self.assertFalse(common._is_export_complete(self.record(), self.tmp_dir))
+
+    def test_checksum_changed(self):
+        """Test that a corrupted file of the same size is only detected with verify."""
+        with open(os.path.join(self.tmp_dir, 'image.tif'), 'wb') as f:
+            f.write(b'9876543210')
+        self.assertTrue(common._is_export_complete(self.record(), self.tmp_dir))
+        self.assertFalse(common._is_export_complete(self.record(), self.tmp_dir, verify=True))
+
+    def test_missing_file(self):
+        """Test that a deleted file is downloaded again."""
+        os.remove(os.path.join(self.tmp_dir, 'image.tif'))
+        self.assertFalse(common._is_export_complete(self.record(), self.tmp_dir))
+
+
+if __name__ == '__main__':
+    unittest.main()
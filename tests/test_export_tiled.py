@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+
+"""Tests for the tiled image download in `eefolium.common`."""
+
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from eefolium import common
+
+
+GRID = {
+    'crs': 'EPSG:32610',
+    'crs_transform': [30, 0, 0, 0, -30, 0],
+    'pixel_size': 30,
+    'col0': 100,
+    'row0': -200,
+    'width': 3,
+    'height': 2,
+    'bands': ['B1', 'B2'],
+    'types': {'B1': {'precision': 'double'}, 'B2': {'precision': 'double'}},
+}
+
+
+class FakeImage:
+    """A stand-in for an ee.Image that records its download requests."""
+
+    def __init__(self):
+        self.requests = []
+
+    def getDownloadURL(self, params):
+        self.requests.append(params)
+        return 'https://download/{}'.format(len(self.requests))
+
+
+class TestDownloadImageTiled(unittest.TestCase):
+    """Tests for `_ee_download_image_tiled`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmp_dir, 'image.tif')
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        shutil.rmtree(self.tmp_dir)
+
+    def download(self, image, stream_download, **kwargs):
+        with mock.patch.object(common, '_ee_pixel_grid', return_value=GRID) as pixel_grid, \
+                mock.patch.object(common, 'stream_download', side_effect=stream_download), \
+                mock.patch.object(common, '_mosaic_geotiffs', return_value=False), \
+                mock.patch('time.sleep'):
+            files = common._ee_download_image_tiled(image, self.filename, region='region', **kwargs)
+        return files, pixel_grid
+
+    def test_native_crs(self):
+        """Test that the grid is computed in the image's own CRS unless one is given."""
+        image = FakeImage()
+        files, pixel_grid = self.download(image, lambda url, filename: None)
+        pixel_grid.assert_called_once_with(image, 'region', None, None)
+        self.assertEqual(files, ['image.tif'])
+        self.assertEqual(image.requests[0]['crs'], 'EPSG:32610')
+        self.assertEqual(image.requests[0]['dimensions'], [3, 2])
+
+    def test_one_pixel_tiles(self):
+        """Test that a request limit below the size of one pixel still downloads one pixel per tile."""
+        image = FakeImage()
+        files, _ = self.download(image, lambda url, filename: None, max_request_bytes=1, max_workers=1)
+        self.assertEqual(len(files), 6)
+        self.assertTrue(all(request['dimensions'] == [1, 1] for request in image.requests))
+        self.assertEqual(image.requests[-1]['crs_transform'], [30, 0, 3060, 0, -30, 5970])
+
+    def test_tile_retries(self):
+        """Test that a failed tile is requested again with a new URL."""
+        failures = ['https://download/1']
+
+        def stream_download(url, filename):
+            if url in failures:
+                raise IOError('connection reset')
+
+        image = FakeImage()
+        files, _ = self.download(image, stream_download, max_retries=1)
+        self.assertEqual(files, ['image.tif'])
+        self.assertEqual(len(image.requests), 2)
+
+        failures.append('https://download/2')
+        image = FakeImage()
+        with self.assertRaises(IOError):
+            self.download(image, stream_download, max_retries=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+"""Tests for the map ID cache in `eefolium.common`."""
+
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from eefolium import common
+
+
+class FakeImage:
+    """A stand-in for an ee.Image that only supports serialize()."""
+
+    def __init__(self, expression):
+        self.expression = expression
+
+    def serialize(self):
+        return self.expression
+
+
+class FakeTileFetcher:
+    def __init__(self, url_format):
+        self.url_format = url_format
+
+
+def stub_ee_image(calls):
+    """Returns a replacement for ee.Image whose getMapId() records its calls."""
+
+    class StubImage:
+        def __init__(self, ee_object):
+            self.ee_object = ee_object
+
+        def getMapId(self, vis_params):
+            calls.append((self.ee_object.expression, vis_params))
+            mapid = 'mapid-{}'.format(len(calls))
+            return {'mapid': mapid, 'tile_fetcher': FakeTileFetcher('https://tiles/{}/{{z}}/{{x}}/{{y}}'.format(mapid))}
+
+    return StubImage
+
+
+class TestMapIdCacheKey(unittest.TestCase):
+    """Tests for `MapIdCache.key`."""
+
+    def test_normalized_vis_params(self):
+        """Test that equivalent visualization parameters share a key."""
+        image = FakeImage('expr')
+        key = common.MapIdCache.key(image, {'bands': ['B4', 'B3', 'B2'], 'min': 0, 'max': 3000})
+        self.assertEqual(key, common.MapIdCache.key(image, {'max': 3000.0, 'min': 0.0, 'bands': 'B4, B3,B2'}))
+        self.assertEqual(common.MapIdCache.key(image, {}), common.MapIdCache.key(image, None))
+
+    def test_distinct_keys(self):
+        """Test that different expressions or parameters get different keys."""
+        image = FakeImage('expr')
+        key = common.MapIdCache.key(image, {'min': 0})
+        self.assertNotEqual(key, common.MapIdCache.key(image, {'min': 1}))
+        self.assertNotEqual(key, common.MapIdCache.key(FakeImage('other'), {'min': 0}))
+
+
+class TestMapIdCache(unittest.TestCase):
+    """Tests for `MapIdCache`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.tmp_dir, 'cache', 'map_ids.db')
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = common.MapIdCache(maxsize=2)
+        cache.set('a', {'mapid': 'a'})
+        cache.set('b', {'mapid': 'b'})
+        cache.get('a')
+        cache.set('c', {'mapid': 'c'})
+        self.assertEqual(cache.get('a'), {'mapid': 'a'})
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), {'mapid': 'c'})
+
+    def test_sqlite_persistence(self):
+        """Test that entries are shared between caches using the same database."""
+        common.MapIdCache(db_path=self.db_path).set('a', {'mapid': 'a'})
+        self.assertEqual(common.MapIdCache(db_path=self.db_path).get('a'), {'mapid': 'a'})
+
+    def test_sqlite_ttl_expiry(self):
+        """Test that expired entries in the database are ignored and deleted."""
+        cache = common.MapIdCache(ttl=60, db_path=self.db_path)
+        cache.set('a', {'mapid': 'a'})
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('UPDATE map_ids SET created = created - 120')
+
+        cache = common.MapIdCache(ttl=60, db_path=self.db_path)
+        self.assertIsNone(cache.get('a'))
+        with sqlite3.connect(self.db_path) as conn:
+            self.assertEqual(conn.execute('SELECT COUNT(*) FROM map_ids').fetchone()[0], 0)
+
+    def test_memory_ttl_expiry(self):
+        """Test that expired entries in memory are ignored."""
+        cache = common.MapIdCache(ttl=60)
+        with mock.patch('time.time', return_value=1000.0):
+            cache.set('a', {'mapid': 'a'})
+        with mock.patch('time.time', return_value=1100.0):
+            self.assertIsNone(cache.get('a'))
+
+    def test_invalidate(self):
+        """Test removing one or all entries."""
+        cache = common.MapIdCache(db_path=self.db_path)
+        cache.set('a', {'mapid': 'a'})
+        cache.set('b', {'mapid': 'b'})
+        cache.invalidate('a')
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), {'mapid': 'b'})
+        cache.invalidate()
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNone(common.MapIdCache(db_path=self.db_path).get('b'))
+
+    def test_get_map_id(self):
+        """Test that get_map_id() only calls getMapId() on cache misses."""
+        calls = []
+        cache = common.MapIdCache()
+        image = FakeImage('expr')
+        with mock.patch.object(common.ee, 'Image', stub_ee_image(calls)):
+            first = common.get_map_id(image, {'min': 0}, cache=cache)
+            second = common.get_map_id(image, {'min': 0.0}, cache=cache)
+            third = common.get_map_id(image, {'min': 1}, cache=cache)
+            uncached = common.get_map_id(image, {'min': 0})
+
+        self.assertEqual(len(calls), 3)
+        self.assertEqual(first, second)
+        self.assertEqual(first['url_format'], 'https://tiles/mapid-1/{z}/{x}/{y}')
+        self.assertNotEqual(first, third)
+        self.assertEqual(uncached['mapid'], 'mapid-3')
+        self.assertEqual(cache.stats(), {'hits': 1, 'misses': 2, 'size': 2})
+
+    def test_concurrent_stats(self):
+        """Test that hit and miss counts are not lost across threads."""
+        cache = common.MapIdCache()
+        cache.set('a', {'mapid': 'a'})
+
+        def lookup():
+            for _ in range(500):
+                cache.get('a')
+                cache.get('b')
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (4000, 4000))
+
+
+if __name__ == '__main__':
+    unittest.main()
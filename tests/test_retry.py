@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+
+"""Tests for the retry helper in `eefolium.common`."""
+
+
+import unittest
+from unittest import mock
+
+from eefolium import common
+
+
+class TestRetry(unittest.TestCase):
+    """Tests for `_retry`."""
+
+    def test_success_after_failures(self):
+        """Test that a call is retried with the attempt number and waits with exponential backoff."""
+        attempts = []
+
+        def func(attempt):
+            attempts.append(attempt)
+            if attempt < 2:
+                raise RuntimeError('attempt {}'.format(attempt))
+            return 'done'
+
+        with mock.patch('time.sleep') as sleep:
+            self.assertEqual(common._retry(func, max_retries=3, backoff=1.5), 'done')
+        self.assertEqual(attempts, [0, 1, 2])
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1.5, 3.0])
+
+    def test_last_error_raised(self):
+        """Test that the last exception is raised once all retries have failed."""
+        def func(attempt):
+            raise ValueError('attempt {}'.format(attempt))
+
+        with mock.patch('time.sleep') as sleep:
+            with self.assertRaisesRegex(ValueError, 'attempt 2'):
+                common._retry(func, max_retries=2)
+        sleep.assert_not_called()
+
+    def test_no_retries(self):
+        """Test that max_retries=0 calls the function once."""
+        func = mock.Mock(side_effect=RuntimeError)
+        with self.assertRaises(RuntimeError):
+            common._retry(func, max_retries=0)
+        func.assert_called_once_with(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
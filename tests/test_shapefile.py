@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""Tests for the shapefile to GeoJSON conversion in `eefolium.common`."""
+
+
+import datetime
+import json
+import os
+import shutil
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+from eefolium import common
+
+try:
+    import shapefile
+    HAS_PYSHP = True
+except ImportError:
+    HAS_PYSHP = False
+
+
+@unittest.skipUnless(HAS_PYSHP, 'pyshp is not installed')
+class TestShpToGeojson(unittest.TestCase):
+    """Tests for `shp_to_geojson`."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.in_shp = os.path.join(self.tmp_dir, 'points.shp')
+        with shapefile.Writer(self.in_shp, shapeType=shapefile.POINT) as writer:
+            writer.field('name', 'C')
+            writer.field('day', 'D')
+            writer.point(1.5, 2.5)
+            writer.record('a', datetime.date(2020, 1, 2))
+            writer.point(-3, 4)
+            writer.record('b', None)
+        self.out_json = os.path.join(self.tmp_dir, 'out', 'points.geojson')
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        shutil.rmtree(self.tmp_dir)
+
+    def test_features(self):
+        """Test the returned and written features, including a date field."""
+        result = common.shp_to_geojson(self.in_shp, self.out_json)
+        with open(self.out_json) as f:
+            self.assertEqual(json.load(f), result)
+        self.assertEqual(result['features'][0], {
+            'type': 'Feature',
+            'geometry': {'type': 'Point', 'coordinates': [1.5, 2.5]},
+            'properties': {'name': 'a', 'day': '2020-01-02'},
+        })
+        self.assertEqual(result['features'][1]['properties'], {'name': 'b', 'day': None})
+        self.assertFalse(os.path.exists(self.out_json + '.part'))
+
+    def test_generator(self):
+        """Test that features can be returned as a generator instead of a list."""
+        result = common.shp_to_geojson(self.in_shp, self.out_json, return_features=False)
+        self.assertIsInstance(result, types.GeneratorType)
+        with open(self.out_json) as f:
+            self.assertEqual(json.load(f)['features'], list(result))
+
+    def test_failure_keeps_existing_file(self):
+        """Test that a failed conversion leaves neither a truncated file nor a partial file."""
+        os.makedirs(os.path.dirname(self.out_json))
+        with open(self.out_json, 'w') as f:
+            f.write('previous')
+
+        dump = json.dump
+        calls = []
+
+        def failing_dump(obj, fp, **kwargs):
+            calls.append(obj)
+            if len(calls) == 2:
+                raise TypeError('not serializable')
+            dump(obj, fp, **kwargs)
+
+        with mock.patch('json.dump', side_effect=failing_dump):
+            self.assertIsNone(common.shp_to_geojson(self.in_shp, self.out_json))
+        with open(self.out_json) as f:
+            self.assertEqual(f.read(), 'previous')
+        self.assertFalse(os.path.exists(self.out_json + '.part'))
+
+
+if __name__ == '__main__':
+    unittest.main()
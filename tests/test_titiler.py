@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+
+"""Tests for the titiler requests in `eefolium.common`, using a stub titiler server."""
+
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from eefolium import common
+
+
+class TitilerHandler(BaseHTTPRequestHandler):
+    """Answers the titiler endpoints used by eefolium and counts the requests and connections."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        url = parse_qs(parsed.query).get('url', [''])[0]
+        with self.server.lock:
+            self.server.counts[parsed.path] = self.server.counts.get(parsed.path, 0) + 1
+            self.server.ports.add(self.client_address[1])
+
+        status = 200
+        if url.endswith('missing.tif'):
+            status, body = 404, {'detail': 'not found'}
+        elif parsed.path.endswith('tilejson.json'):
+            body = {'tiles': ['http://tiles/{z}/{x}/{y}'], 'bounds': [0, 0, 2, 2]}
+        elif parsed.path.endswith('bounds'):
+            body = {'bounds': [0, 0, 2, 2]}
+        else:
+            body = {'band_descriptions': [['b1', 'red'], ['b2', 'green']]}
+
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestTitiler(unittest.TestCase):
+    """Tests for `_titiler_get` and the COG functions that use it."""
+
+    def setUp(self):
+        """Set up test fixtures, if any."""
+        common.titiler_cache.clear()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), TitilerHandler)
+        self.server.counts = {}
+        self.server.ports = set()
+        self.server.lock = threading.Lock()
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.endpoint = 'http://127.0.0.1:{}'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        """Tear down test fixtures, if any."""
+        common.get_titiler_session().close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_cache(self):
+        """Test that repeated requests are answered from the cache."""
+        for _ in range(3):
+            self.assertEqual(common.get_COG_bounds('http://cogs/a.tif', self.endpoint, local=False), [0, 0, 2, 2])
+        common.get_COG_bounds('http://cogs/b.tif', self.endpoint, local=False)
+        self.assertEqual(self.server.counts, {'/cog/bounds': 2})
+
+        common._titiler_get(self.endpoint + '/cog/bounds', {'url': 'http://cogs/a.tif'}, cache=False)
+        self.assertEqual(self.server.counts, {'/cog/bounds': 3})
+
+    def test_cached_copies(self):
+        """Test that modifying a returned response does not change the cached one."""
+        bounds = common.get_COG_bounds('http://cogs/a.tif', self.endpoint, local=False)
+        bounds[0] = 100
+        self.assertEqual(common.get_COG_bounds('http://cogs/a.tif', self.endpoint, local=False), [0, 0, 2, 2])
+
+        tilejson = common.get_COG_tilejson('http://cogs/a.tif', self.endpoint)
+        tilejson['tiles'].append('http://other/{z}/{x}/{y}')
+        self.assertEqual(common.get_COG_tilejson('http://cogs/a.tif', self.endpoint)['tiles'],
+                         ['http://tiles/{z}/{x}/{y}'])
+        self.assertEqual(self.server.counts['/cog/WebMercatorQuad/tilejson.json'], 1)
+
+    def test_errors_not_cached(self):
+        """Test that error responses are requested again."""
+        url = self.endpoint + '/cog/bounds'
+        for _ in range(2):
+            self.assertEqual(common._titiler_get(url, {'url': 'http://cogs/missing.tif'}), {'detail': 'not found'})
+        self.assertEqual(self.server.counts, {'/cog/bounds': 2})
+
+    def test_session_reuse(self):
+        """Test that sequential requests share one connection."""
+        for i in range(5):
+            common.get_COG_bands('http://cogs/{}.tif'.format(i), self.endpoint, local=False)
+        self.assertEqual(self.server.counts, {'/cog/info': 5})
+        self.assertEqual(len(self.server.ports), 1)
+
+    def test_bounds_list(self):
+        """Test that concurrent requests return the bounds in the order of the links."""
+        links = ['http://cogs/{}.tif'.format(i) for i in range(4)] + ['http://cogs/missing.tif']
+        bounds = common.get_COG_bounds_list(links, self.endpoint, max_workers=4, max_retries=0)
+        self.assertEqual(bounds, [[0, 0, 2, 2]] * 4 + [None])
+
+
+if __name__ == '__main__':
+    unittest.main()